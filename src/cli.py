@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 from rich.console import Console
 from rich.live import Live
-from rich.console import Group
 from rich.panel import Panel
 
 # Configurar el path para las importaciones
@@ -87,7 +86,20 @@ class GPTCLI:
         
         # Current state
         self.current_model = self.config.get('default_model', 'openai/gpt-oss-20b')
-        
+
+        # Constant-time dispatch for built-in commands (replaces if/elif chain)
+        self._cmd_dispatch = {
+            'help': self._cmd_help,
+            'status': self._cmd_status,
+            'new': self._cmd_new,
+            'clear': self._cmd_clear,
+            'history': self._cmd_history,
+            'model': self._cmd_model,
+            'config': self._cmd_config,
+            'settings': self._cmd_config,
+            'thinking': self._cmd_thinking,
+        }
+
     def display_welcome(self):
         """Display compact welcome message."""
         thinking_mode = self.config.get('thinking_mode', 'normal')
@@ -350,34 +362,62 @@ class GPTCLI:
                     # Streaming response for models that support it (when reasoning doesn't require non-streaming)
                     full_content = ""
                     reasoning_content = None
-                    
-                    for chunk_data in self.groq_client.stream_completion(api_messages, model):
-                        if chunk_data.get("type") == "content":
-                            full_content += chunk_data.get("data", "")
-                        elif chunk_data.get("type") == "reasoning":
-                            reasoning_content = chunk_data.get("data")
-                        elif chunk_data.get("type") == "error":
-                            self.console.print(f"[red]Error: {chunk_data.get('data')}[/red]")
-                            return
-                            
-                        # Update display
+
+                    # Reuse panel objects across chunk updates instead of
+                    # allocating new Rich panels on every streamed token
+                    thinking_panel = self.panel_factory.create_info_panel("Thinking...", "Status")
+                    response_panel = None
+                    reasoning_panel = None
+
+                    def build_panels():
+                        nonlocal reasoning_panel, response_panel
                         panels = []
-                        
+
                         # Show reasoning panel first (if available and enabled)
                         if reasoning_content and self.config.get('show_reasoning_panel', True):
-                            reasoning_panel = self.panel_factory.create_reasoning_panel(reasoning_content)
+                            if reasoning_panel is None:
+                                reasoning_panel = self.panel_factory.create_reasoning_panel(reasoning_content)
+                            else:
+                                self.panel_factory.update_reasoning_panel(reasoning_panel, reasoning_content)
                             if reasoning_panel:
                                 panels.append(reasoning_panel)
-                        
+
                         # Show response panel
                         if full_content:
-                            panels.append(self.panel_factory.create_response_panel(full_content))
+                            if response_panel is None:
+                                response_panel = self.panel_factory.create_response_panel(full_content)
+                            else:
+                                self.panel_factory.update_response_panel(response_panel, full_content)
+                            panels.append(response_panel)
                         else:
-                            panels.append(self.panel_factory.create_info_panel("Thinking...", "Status"))
-                        
+                            panels.append(thinking_panel)
+
+                        return panels
+
+                    for chunk_data in self.groq_client.stream_completion(api_messages, model):
+                        if chunk_data.get("type") == "content":
+                            full_content += chunk_data.get("data", "")
+                        elif chunk_data.get("type") == "reasoning":
+                            reasoning_content = chunk_data.get("data")
+                        elif chunk_data.get("type") == "error":
+                            self.console.print(f"[red]Error: {chunk_data.get('data')}[/red]")
+                            return
+
+                        # Tokens arrive faster than the terminal can
+                        # repaint; rebuild panels at most ~30 times/sec
+                        if not self.panel_factory.should_render():
+                            continue
+
+                        panels = build_panels()
                         if panels:
-                            live.update(Group(*panels))
-                    
+                            live.update(self.panel_factory.render_batch(*panels))
+
+                    # Final frame with the complete content, regardless
+                    # of where the render gate last fired
+                    panels = build_panels()
+                    if panels:
+                        live.update(self.panel_factory.render_batch(*panels))
+
                     # Add to conversation
                     if full_content:
                         self.conversation.add_message("assistant", full_content)
@@ -413,7 +453,7 @@ class GPTCLI:
                     
                     # Update display with all panels at once - this replaces any previous status
                     if panels:
-                        live.update(Group(*panels))
+                        live.update(self.panel_factory.render_batch(*panels))
                         self.conversation.add_message("assistant", content)
                     else:
                         live.update(self.panel_factory.create_error_panel("No response received"))
@@ -426,6 +466,89 @@ class GPTCLI:
                 live.update(error_panel)
                 return
     
+    def _cmd_help(self, args: List[str]) -> bool:
+        """Built-in 'help' command."""
+        self._show_help()
+        return True
+
+    def _cmd_status(self, args: List[str]) -> bool:
+        """Built-in 'status' command."""
+        self._show_status()
+        return True
+
+    def _cmd_new(self, args: List[str]) -> bool:
+        """Built-in 'new' command - start a fresh session."""
+        self.conversation = Conversation()
+        self.current_model = self.config.get('default_model', 'openai/gpt-oss-20b')
+        self.console.print("[green]✅ Started new chat session.[/green]")
+        return True
+
+    def _cmd_clear(self, args: List[str]) -> bool:
+        """Built-in 'clear' command."""
+        self.conversation.clear()
+        self.console.print("[green]✅ Conversation history cleared.[/green]")
+        return True
+
+    def _cmd_history(self, args: List[str]) -> bool:
+        """Built-in 'history' command."""
+        if self.conversation.messages:
+            history_table = self.table_factory.create_history_table(
+                self.conversation.get_messages_for_api()
+            )
+            self.console.print(history_table)
+        else:
+            self.console.print("[yellow]No conversation history.[/yellow]")
+        return True
+
+    def _cmd_model(self, args: List[str]) -> bool:
+        """Built-in 'model' command - switch or reset model."""
+        error = CommandValidator.validate_model_command(args)
+        if error:
+            self.console.print(f"[red]{error}[/red]")
+        else:
+            if not args:
+                # Reset to default
+                self.current_model = self.config.get('default_model', 'openai/gpt-oss-20b')
+                self.console.print(f"[green]✅ Reset to default model: {self.current_model}[/green]")
+            else:
+                # Switch to specific model
+                self.current_model = args[0]
+                self.console.print(f"[green]✅ Switched to model: {self.current_model}[/green]")
+        return True
+
+    def _cmd_config(self, args: List[str]) -> bool:
+        """Built-in 'config' / 'settings' command."""
+        self._show_config()
+        return True
+
+    def _cmd_thinking(self, args: List[str]) -> bool:
+        """Built-in 'thinking' command - toggle thinking mode."""
+        current_mode = self.config.get('thinking_mode', 'normal')
+        new_mode = 'hard' if current_mode == 'normal' else 'normal'
+
+        # Update config
+        self.config.set('thinking_mode', new_mode)
+
+        # Save configuration to file
+        try:
+            self.config.save_to_file(self.config_path)
+        except Exception as e:
+            self.console.print(f"[red]⚠️  Warning: Could not save configuration: {str(e)}[/red]")
+
+        # Show status
+        mode_display = "🔍 Hard Thinking (Deep Analysis)" if new_mode == 'hard' else "⚡ Normal Thinking (Fast Response)"
+        self.console.print(f"[green]✅ Thinking mode switched to: {mode_display}[/green]")
+
+        if new_mode == 'hard':
+            self.console.print("[blue]💡 Hard thinking mode activated. The AI will use an 8-step optimized prompt sequence for complex analysis.[/blue]")
+        else:
+            self.console.print("[blue]💡 Normal thinking mode activated. The AI will provide fast, direct responses.[/blue]")
+
+        # Update status bar to reflect the change
+        self.display_status_bar()
+
+        return True
+
     def handle_command(self, user_input: str) -> bool:
         """Handle command input. Returns True if was a command."""
         # Parse command
@@ -436,89 +559,16 @@ class GPTCLI:
         
         command = cmd_info['command']
         args = cmd_info['args']
-        
+
         # Clear help line before command output to prevent overwriting
         self._clear_help_line()
-        
-        # Built-in commands
-        if command == 'help':
-            self._show_help()
-            return True
-            
-        elif command == 'status':
-            self._show_status()
-            return True
-            
-        elif command == 'new':
-            self.conversation = Conversation()
-            self.current_model = self.config.get('default_model', 'openai/gpt-oss-20b')
-            self.console.print("[green]✅ Started new chat session.[/green]")
-            return True
-        
-        elif command == 'clear':
-            self.conversation.clear()
-            self.console.print("[green]✅ Conversation history cleared.[/green]")
-            return True
-        
-        elif command == 'history':
-            if self.conversation.messages:
-                history_table = self.table_factory.create_history_table(
-                    self.conversation.get_messages_for_api()
-                )
-                self.console.print(history_table)
-            else:
-                self.console.print("[yellow]No conversation history.[/yellow]")
-            return True
-        
-    # Note: explicit 'exit' / 'quit' commands removed — user quits with Ctrl+C
-        
-        elif command == 'model':
-            error = CommandValidator.validate_model_command(args)
-            if error:
-                self.console.print(f"[red]{error}[/red]")
-            else:
-                if not args:
-                    # Reset to default
-                    self.current_model = self.config.get('default_model', 'openai/gpt-oss-20b')
-                    self.console.print(f"[green]✅ Reset to default model: {self.current_model}[/green]")
-                else:
-                    # Switch to specific model
-                    self.current_model = args[0]
-                    self.console.print(f"[green]✅ Switched to model: {self.current_model}[/green]")
-            return True
-        
-        elif command == 'config' or command == 'settings':
-            self._show_config()
-            return True
-        
-        elif command == 'thinking':
-            # Toggle thinking mode
-            current_mode = self.config.get('thinking_mode', 'normal')
-            new_mode = 'hard' if current_mode == 'normal' else 'normal'
-            
-            # Update config
-            self.config.set('thinking_mode', new_mode)
-            
-            # Save configuration to file
-            try:
-                self.config.save_to_file(self.config_path)
-            except Exception as e:
-                self.console.print(f"[red]⚠️  Warning: Could not save configuration: {str(e)}[/red]")
-            
-            # Show status
-            mode_display = "🔍 Hard Thinking (Deep Analysis)" if new_mode == 'hard' else "⚡ Normal Thinking (Fast Response)"
-            self.console.print(f"[green]✅ Thinking mode switched to: {mode_display}[/green]")
-            
-            if new_mode == 'hard':
-                self.console.print("[blue]💡 Hard thinking mode activated. The AI will use an 8-step optimized prompt sequence for complex analysis.[/blue]")
-            else:
-                self.console.print("[blue]💡 Normal thinking mode activated. The AI will provide fast, direct responses.[/blue]")
-            
-            # Update status bar to reflect the change
-            self.display_status_bar()
-            
-            return True
-        
+
+        # Built-in commands via constant-time dispatch
+        # Note: explicit 'exit' / 'quit' commands removed — user quits with Ctrl+C
+        handler = self._cmd_dispatch.get(command)
+        if handler:
+            return handler(args)
+
         # Try command handler for other commands
         result = self.command_handler.execute(user_input)
         if result is not None:
@@ -1,37 +1,79 @@
 """Conversation model for managing chat sessions."""
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import itertools
 import json
+import mmap
+import os
+import time
 from models.message import Message
 
+# Prefer orjson for (de)serialization when available; it is several times
+# faster than the stdlib on dict-heavy payloads and emits bytes directly.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+    _HAS_ORJSON = True
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+    _HAS_ORJSON = False
+
+# Below this size mmap setup costs more than it saves (page granularity)
+_MMAP_THRESHOLD = 16 * 1024
+
+# Per-process sequence appended to session IDs; the timestamp alone has
+# one-second granularity and could collide
+_session_seq = itertools.count(1)
+
 
 class Conversation:
     """Manages a conversation session with messages and metadata."""
-    
+
+    __slots__ = ('session_id', 'messages', 'created_at', 'model', 'metadata',
+                 '_api_messages')
+
     def __init__(self, session_id: Optional[str] = None):
         self.session_id = session_id or self._generate_session_id()
         self.messages: List[Message] = []
-        self.created_at = datetime.now()
+        # Stored as an epoch float; converted to datetime only when exported.
+        self.created_at = time.time()
         self.model = "openai/gpt-oss-20b"
         self.metadata: Dict[str, Any] = {}
-    
+        # API-format mirror of messages, maintained incrementally so each
+        # send only pays for the newly added message instead of rebuilding
+        # the whole list.
+        self._api_messages: List[Dict[str, str]] = []
+
     def _generate_session_id(self) -> str:
         """Generate a unique session ID."""
-        return f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    
+        return f"session_{time.strftime('%Y%m%d_%H%M%S')}_{next(_session_seq)}"
+
     def add_message(self, role: str, content: str, metadata: Optional[Dict[str, Any]] = None) -> Message:
         """Add a new message to the conversation."""
         message = Message(role=role, content=content, metadata=metadata)
         self.messages.append(message)
+        self._api_messages.append({"role": role, "content": content})
         return message
-    
+
     def get_messages_for_api(self) -> List[Dict[str, str]]:
-        """Get messages in format expected by API."""
-        return [{"role": msg.role, "content": msg.content} for msg in self.messages]
-    
+        """Get messages in format expected by API.
+
+        Returns the incrementally maintained list; callers must treat it
+        as read-only.
+        """
+        return self._api_messages
+
     def clear(self):
         """Clear all messages from the conversation."""
         self.messages.clear()
+        self._api_messages.clear()
     
     def get_message_count(self) -> int:
         """Get total number of messages."""
@@ -49,6 +91,67 @@ class Conversation:
         """Get total character count of all messages."""
         return sum(len(msg.content) for msg in self.messages)
     
+    def export_to_dict(self) -> Dict[str, Any]:
+        """Export the conversation to a JSON-serializable dict."""
+        return {
+            'session_id': self.session_id,
+            'created_at': datetime.fromtimestamp(self.created_at).isoformat(),
+            'model': self.model,
+            'metadata': self.metadata,
+            'messages': [
+                {
+                    'role': msg.role,
+                    'content': msg.content,
+                    'timestamp': msg.timestamp.isoformat() if msg.timestamp else None,
+                    'metadata': msg.metadata,
+                }
+                for msg in self.messages
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Conversation':
+        """Rebuild a conversation from an exported dict."""
+        conversation = cls(session_id=data.get('session_id'))
+        created_at = data.get('created_at')
+        if created_at:
+            conversation.created_at = datetime.fromisoformat(created_at).timestamp()
+        conversation.model = data.get('model', conversation.model)
+        conversation.metadata = data.get('metadata', {})
+        for msg in data.get('messages', []):
+            message = conversation.add_message(
+                msg['role'], msg['content'], msg.get('metadata')
+            )
+            if msg.get('timestamp'):
+                message.timestamp = datetime.fromisoformat(msg['timestamp'])
+        return conversation
+
+    def save_to_file(self, filepath: str) -> None:
+        """Save the conversation to a JSON file."""
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(self.export_to_dict()))
+
+    @classmethod
+    def load_from_file(cls, filepath: str) -> 'Conversation':
+        """Load a conversation from a JSON file.
+
+        Large files are memory-mapped and parsed in place, avoiding an
+        intermediate bytes copy; small files are read directly.
+        """
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size >= _MMAP_THRESHOLD:
+                with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                    # orjson parses straight from the mapped buffer; the
+                    # stdlib parser needs a real bytes object
+                    data = _loads(memoryview(mm) if _HAS_ORJSON else mm[:])
+            else:
+                data = _loads(os.read(fd, size))
+        finally:
+            os.close(fd)
+        return cls.from_dict(data)
+
     def search_messages(self, query: str, case_sensitive: bool = False) -> List[Message]:
         """Search for messages containing the query."""
         if not case_sensitive:
@@ -35,7 +35,7 @@ class AnalysisManager:
                 model = 'openai/gpt-oss-20b'
             
             # Use streaming and collect full response
-            full_response = ""
+            parts = []
             stream = self.groq_client.create_completion(
                 messages=messages,
                 model=model,
@@ -43,16 +43,19 @@ class AnalysisManager:
                 max_completion_tokens=4096,
                 temperature=0.8
             )
-            
-            # Collect all chunks
+
+            # Collect all chunks (same EAFP pattern as the prompt engine)
             for chunk in stream:
-                if hasattr(chunk, 'choices') and chunk.choices:
-                    if hasattr(chunk.choices[0], 'delta') and chunk.choices[0].delta:
-                        if hasattr(chunk.choices[0].delta, 'content') and chunk.choices[0].delta.content:
-                            full_response += chunk.choices[0].delta.content
-            
-            if full_response.strip():
-                return full_response.strip()
+                try:
+                    content = chunk.choices[0].delta.content
+                except (AttributeError, IndexError):
+                    content = None
+                if content:
+                    parts.append(content)
+
+            full_response = ''.join(parts).strip()
+            if full_response:
+                return full_response
             else:
                 return "Error: No response content received from API"
                 
@@ -1,4 +1,5 @@
 """Groq client service for API interactions."""
+import functools
 from typing import Dict, Any, Optional, Iterator, List
 from groq import Groq
 import time
@@ -7,6 +8,77 @@ from utils.error_handler import RetryHandler, NetworkChecker
 from models.message import Message
 
 
+# Share SDK client / retry handler instances across GroqClient objects;
+# both are effectively constant for a given api key and retry count
+@functools.lru_cache(maxsize=4)
+def _make_groq(api_key: str) -> Groq:
+    return Groq(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _make_retry_handler(max_retries: int) -> RetryHandler:
+    return RetryHandler(max_retries=max_retries, base_delay=1.0)
+
+# Static model capability table, built once at import (get_model_info is
+# queried per render in UI code)
+_MODEL_INFO = {
+    "openai/gpt-oss-20b": {
+        "name": "GPT-OSS 20B",
+        "description": "Standard 20B parameter model",
+        "supports_streaming": True,
+        "supports_tools": False,
+        "supports_reasoning": True,
+        "reasoning_requires_non_streaming": True,
+        "max_tokens": 8192
+    },
+    "openai/gpt-oss-120b": {
+        "name": "GPT-OSS 120B",
+        "description": "Larger 120B parameter model",
+        "supports_streaming": True,
+        "supports_tools": False,
+        "supports_reasoning": True,
+        "reasoning_requires_non_streaming": True,
+        "max_tokens": 8192
+    },
+    "compound-beta": {
+        "name": "Compound AI Beta",
+        "description": "AI with web search & code execution (multiple tools)",
+        "supports_streaming": False,
+        "supports_tools": True,
+        "supports_reasoning": False,
+        "reasoning_requires_non_streaming": False,
+        "max_tokens": 8192
+    },
+    "compound-beta-mini": {
+        "name": "Compound AI Beta Mini",
+        "description": "AI with web search & code execution (single tool, 3x faster)",
+        "supports_streaming": False,
+        "supports_tools": True,
+        "supports_reasoning": False,
+        "reasoning_requires_non_streaming": False,
+        "max_tokens": 8192
+    }
+}
+
+_DEFAULT_MODEL_INFO = {
+    "name": "unknown",
+    "description": "Unknown model",
+    "supports_streaming": True,
+    "supports_tools": False,
+    "supports_reasoning": False,
+    "reasoning_requires_non_streaming": False,
+    "max_tokens": 8192
+}
+
+# O(1) membership for the hot validate_model path
+_VALID_MODELS = frozenset({
+    "openai/gpt-oss-20b",
+    "openai/gpt-oss-120b",
+    "compound-beta",
+    "compound-beta-mini",
+})
+
+
 class GroqClient:
     """Enhanced Groq client with retry logic and error handling."""
     
@@ -21,27 +93,35 @@ class GroqClient:
                 "or add 'api_key' to your config.json file."
             )
         
-        self.client = Groq(api_key=api_key)
-        self.retry_handler = RetryHandler(
-            max_retries=config.get('retry_attempts', 3),
-            base_delay=1.0
-        )
-        self.valid_models = [
-            "openai/gpt-oss-20b",
-            "openai/gpt-oss-120b", 
-            "compound-beta",
-            "compound-beta-mini"
-        ]
-    
+        self.client = _make_groq(api_key)
+        self.retry_handler = _make_retry_handler(config.get('retry_attempts', 3))
+        self.valid_models = _VALID_MODELS
+        # (timestamp, result) of the last connectivity probe
+        self._conn_cache = (0.0, True)
+        # Static per-model request parameters, built on first use
+        self._params_cache: Dict[str, Dict[str, Any]] = {}
+
     def validate_model(self, model: str) -> bool:
         """Validate if model is supported."""
-        return model in self.valid_models
-    
+        return model in _VALID_MODELS
+
+    # Connectivity probes are memoized so a burst of completions (e.g. the
+    # 8-step prompt sequence) performs at most one network round-trip
+    _CONN_TTL = 5.0
+
     def check_connectivity(self) -> bool:
-        """Check if we can connect to Groq API."""
-        # Skip connectivity check for now as it's causing issues
-        # The actual API call will handle connection errors
-        return True
+        """Check if we can connect to Groq API (cached for a short TTL)."""
+        checked_at, connected = self._conn_cache
+        now = time.monotonic()
+        if now - checked_at < self._CONN_TTL:
+            return connected
+        connected = NetworkChecker.is_connected()
+        self._conn_cache = (now, connected)
+        return connected
+
+    def _invalidate_connectivity(self) -> None:
+        """Drop the cached probe result after a real connection error."""
+        self._conn_cache = (0.0, True)
     
     def create_completion(
         self, 
@@ -52,27 +132,32 @@ class GroqClient:
     ) -> Any:
         """Create a completion with retry logic."""
         if not self.validate_model(model):
-            raise ValueError(f"Invalid model: {model}. Valid models: {self.valid_models}")
-        
-        if not self.check_connectivity():
-            raise ConnectionError("Cannot connect to Groq API. Check your internet connection.")
-        
-        # Default parameters
-        params = {
-            "model": model,
-            "messages": messages,
-            "temperature": self.config.get('temperature', 1.0),
-            "max_completion_tokens": self.config.get('max_tokens', 8192),
-            "top_p": 1,
-            "stream": stream,
-            "stop": None
-        }
-        
-        # Add reasoning parameters for non-compound models
-        if not model.startswith("compound-"):
-            params["reasoning_effort"] = self.config.get('reasoning_effort', 'medium')
-            params["include_reasoning"] = self.config.get('include_reasoning', True)
-        
+            raise ValueError(f"Invalid model: {model}. Valid models: {sorted(_VALID_MODELS)}")
+
+        # No up-front connectivity probe: the API call fails naturally and
+        # the RetryHandler classifies connection errors (consulting
+        # NetworkChecker only when one actually occurs)
+
+        # Static parameters for this model, built once and copied per call
+        template = self._params_cache.get(model)
+        if template is None:
+            template = {
+                "model": model,
+                "temperature": self.config.get('temperature', 1.0),
+                "max_completion_tokens": self.config.get('max_tokens', 8192),
+                "top_p": 1,
+                "stop": None
+            }
+            # Add reasoning parameters for non-compound models
+            if not model.startswith("compound-"):
+                template["reasoning_effort"] = self.config.get('reasoning_effort', 'medium')
+                template["include_reasoning"] = self.config.get('include_reasoning', True)
+            self._params_cache[model] = template
+
+        params = template.copy()
+        params["messages"] = messages
+        params["stream"] = stream
+
         # Override with any provided kwargs
         params.update(kwargs)
         
@@ -91,18 +176,23 @@ class GroqClient:
         """Stream completion tokens with reasoning support."""
         try:
             stream = self.create_completion(messages, model, stream=True, **kwargs)
-            full_content = ""
             reasoning = None
-            
+            is_compound = model.startswith("compound-")
+
             for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    content_chunk = chunk.choices[0].delta.content
-                    full_content += content_chunk
+                # EAFP: malformed chunks are the rare case, so a single
+                # try/except beats per-chunk hasattr introspection
+                try:
+                    choice = chunk.choices[0]
+                    content_chunk = choice.delta.content
+                except (AttributeError, IndexError):
+                    continue
+                if content_chunk:
                     yield {"type": "content", "data": content_chunk}
-                
+
                 # Check for reasoning in the final chunk
-                if chunk.choices[0].finish_reason and not model.startswith("compound-"):
-                    reasoning = getattr(chunk.choices[0].message, 'reasoning', None) if hasattr(chunk.choices[0], 'message') else None
+                if choice.finish_reason and not is_compound:
+                    reasoning = getattr(getattr(choice, 'message', None), 'reasoning', None)
             
             # Send reasoning at the end if available
             if reasoning:
@@ -148,51 +238,7 @@ class GroqClient:
     
     def get_model_info(self, model: str) -> Dict[str, Any]:
         """Get information about a model."""
-        model_info = {
-            "openai/gpt-oss-20b": {
-                "name": "GPT-OSS 20B",
-                "description": "Standard 20B parameter model",
-                "supports_streaming": True,
-                "supports_tools": False,
-                "supports_reasoning": True,
-                "reasoning_requires_non_streaming": True,
-                "max_tokens": 8192
-            },
-            "openai/gpt-oss-120b": {
-                "name": "GPT-OSS 120B", 
-                "description": "Larger 120B parameter model",
-                "supports_streaming": True,
-                "supports_tools": False,
-                "supports_reasoning": True,
-                "reasoning_requires_non_streaming": True,
-                "max_tokens": 8192
-            },
-            "compound-beta": {
-                "name": "Compound AI Beta",
-                "description": "AI with web search & code execution (multiple tools)",
-                "supports_streaming": False,
-                "supports_tools": True,
-                "supports_reasoning": False,
-                "reasoning_requires_non_streaming": False,
-                "max_tokens": 8192
-            },
-            "compound-beta-mini": {
-                "name": "Compound AI Beta Mini",
-                "description": "AI with web search & code execution (single tool, 3x faster)", 
-                "supports_streaming": False,
-                "supports_tools": True,
-                "supports_reasoning": False,
-                "reasoning_requires_non_streaming": False,
-                "max_tokens": 8192
-            }
-        }
-        
-        return model_info.get(model, {
-            "name": model,
-            "description": "Unknown model",
-            "supports_streaming": True,
-            "supports_tools": False,
-            "supports_reasoning": False,
-            "reasoning_requires_non_streaming": False,
-            "max_tokens": 8192
-        })
+        info = _MODEL_INFO.get(model)
+        if info is None:
+            info = dict(_DEFAULT_MODEL_INFO, name=model)
+        return info
@@ -1,4 +1,6 @@
 """Prompt Engine for optimized thinking sequence."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Callable, Optional
 from .prompt_templates import get_prompt_template, PROMPT_TEMPLATES
 
@@ -10,6 +12,7 @@ class PromptEngine:
         self.groq_client = groq_client
         self.prompts = PROMPT_TEMPLATES
         self.state = {}
+        self._state_lock = threading.Lock()
 
     def _load_prompt_templates(self) -> Dict[int, Dict[str, str]]:
         """Load all prompt templates."""
@@ -27,24 +30,25 @@ class PromptEngine:
         if not template:
             raise ValueError(f"No template found for step {step_number}")
 
-        # Build the prompt by replacing placeholders
-        prompt = template["template"].format(
-            user_question=user_question,
-            response_1=previous_responses.get(1, ""),
-            response_2=previous_responses.get(2, ""),
-            response_3=previous_responses.get(3, ""),
-            response_4=previous_responses.get(4, ""),
-            response_5=previous_responses.get(5, ""),
-            response_6=previous_responses.get(6, ""),
-            response_7=previous_responses.get(7, "")
-        )
+        # Build the prompt from the precompiled segments, substituting only
+        # the placeholders this template actually references
+        values = {}
+        for field in template["fields"]:
+            if field == "user_question":
+                values[field] = user_question
+            else:
+                # Fields are named response_<step>
+                values[field] = previous_responses.get(
+                    int(field.rsplit('_', 1)[1]), "")
+        prompt = template["render"](values)
 
         # Execute the prompt using groq_client
         client = groq_client or self.groq_client
         response = self._execute_prompt_with_client(prompt, client)
 
-        # Store the response in state
-        self.state[step_number] = response
+        # Store the response in state (steps 6 and 7 may run concurrently)
+        with self._state_lock:
+            self.state[step_number] = response
 
         return response
 
@@ -54,26 +58,58 @@ class PromptEngine:
         groq_client: Any,
         progress_callback: Optional[Callable[[int, str], None]] = None
     ) -> Dict[int, str]:
-        """Execute the complete 8-step optimized sequence."""
+        """Execute the complete 8-step optimized sequence.
+
+        Steps 6 and 7 both depend only on earlier responses, so their API
+        calls are overlapped; everything else runs sequentially.
+        """
         responses = {}
 
-        for step in range(1, 9):  # Steps 1-8
+        def announce(step: int) -> None:
             if progress_callback:
                 step_info = get_prompt_template(step)
                 progress_callback(step, step_info.get("name", f"Step {step}"))
 
+        def record_error(step: int, exc: Exception) -> None:
+            # Handle errors gracefully - could implement retry logic here
+            error_msg = f"Error in step {step}: {str(exc)}"
+            responses[step] = error_msg
+            if progress_callback:
+                progress_callback(step, f"Error: {error_msg}")
+
+        for step in (1, 2, 3, 4, 5):
+            announce(step)
             try:
-                response = self.execute_single_prompt(
+                responses[step] = self.execute_single_prompt(
                     step, user_question, responses, groq_client
                 )
-                responses[step] = response
-
             except Exception as e:
-                # Handle errors gracefully - could implement retry logic here
-                error_msg = f"Error in step {step}: {str(e)}"
-                responses[step] = error_msg
-                if progress_callback:
-                    progress_callback(step, f"Error: {error_msg}")
+                record_error(step, e)
+
+        # Steps 6 and 7 are independent of each other - run them concurrently
+        announce(6)
+        announce(7)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                step: executor.submit(
+                    self.execute_single_prompt,
+                    step, user_question, responses, groq_client
+                )
+                for step in (6, 7)
+            }
+        for step, future in futures.items():
+            try:
+                responses[step] = future.result()
+            except Exception as e:
+                record_error(step, e)
+
+        announce(8)
+        try:
+            responses[8] = self.execute_single_prompt(
+                8, user_question, responses, groq_client
+            )
+        except Exception as e:
+            record_error(8, e)
 
         return responses
 
@@ -91,9 +127,10 @@ class PromptEngine:
             else:
                 model = 'openai/gpt-oss-20b'
             
-            # Use streaming to collect the full response
-            full_response = ""
-            
+            # Use streaming to collect the full response; append chunks to a
+            # list and join once to avoid quadratic string concatenation
+            parts: List[str] = []
+
             # Create streaming completion
             stream = groq_client.create_completion(
                 messages=messages,
@@ -102,16 +139,20 @@ class PromptEngine:
                 max_completion_tokens=2048,
                 temperature=0.7
             )
-            
-            # Collect all chunks into a full response
+
+            # Collect all chunks into a full response (EAFP beats the
+            # hasattr chain when well-formed chunks are the common case)
             for chunk in stream:
-                if hasattr(chunk, 'choices') and chunk.choices:
-                    if hasattr(chunk.choices[0], 'delta') and chunk.choices[0].delta:
-                        if hasattr(chunk.choices[0].delta, 'content') and chunk.choices[0].delta.content:
-                            full_response += chunk.choices[0].delta.content
-            
-            if full_response.strip():
-                return full_response.strip()
+                try:
+                    content = chunk.choices[0].delta.content
+                except (AttributeError, IndexError):
+                    content = None
+                if content:
+                    parts.append(content)
+
+            full_response = ''.join(parts).strip()
+            if full_response:
+                return full_response
             else:
                 return "Error: No response content received from API"
                 
@@ -59,6 +59,35 @@ Estructura tu respuesta final en dos partes:
     }
 }
 
+def _compile_templates() -> None:
+    """Pre-parse each template once at import time.
+
+    Stores the literal/placeholder segments and the set of fields each
+    template actually references, so rendering is a join over segments
+    instead of a full str.format placeholder scan with 8 kwargs per call.
+    """
+    import string
+    formatter = string.Formatter()
+    for template in PROMPT_TEMPLATES.values():
+        segments = [(literal, field)
+                    for literal, field, _, _ in formatter.parse(template["template"])]
+        template["fields"] = tuple({field for _, field in segments if field})
+
+        def render(values, _segments=segments):
+            parts = []
+            for literal, field in _segments:
+                if literal:
+                    parts.append(literal)
+                if field:
+                    parts.append(values[field])
+            return ''.join(parts)
+
+        template["render"] = render
+
+
+_compile_templates()
+
+
 def get_prompt_template(step_number: int) -> dict:
     """Get prompt template for a specific step."""
     return PROMPT_TEMPLATES.get(step_number, {})
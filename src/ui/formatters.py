@@ -1,7 +1,217 @@
-"""UI formatters for text processing."""
+"""UI formatters for text processing.
+
+The math transformer lives in module-level functions so hot callers
+(per streamed chunk) hit a direct global lookup; the MathFormatter
+class below re-exports them for the existing call sites.
+"""
+import functools
 import re
 from typing import Optional
 
+# Extended Greek letters support
+GREEK = {
+    r"\\alpha": "α", r"\\Alpha": "Α",
+    r"\\beta": "β", r"\\Beta": "Β",
+    r"\\gamma": "γ", r"\\Gamma": "Γ",
+    r"\\delta": "δ", r"\\Delta": "Δ",
+    r"\\epsilon": "ε", r"\\varepsilon": "ε",
+    r"\\zeta": "ζ", r"\\Zeta": "Ζ",
+    r"\\eta": "η", r"\\Eta": "Η",
+    r"\\theta": "θ", r"\\Theta": "Θ", r"\\vartheta": "ϑ",
+    r"\\iota": "ι", r"\\Iota": "Ι",
+    r"\\kappa": "κ", r"\\Kappa": "Κ",
+    r"\\lambda": "λ", r"\\Lambda": "Λ",
+    r"\\mu": "μ", r"\\Mu": "Μ",
+    r"\\nu": "ν", r"\\Nu": "Ν",
+    r"\\xi": "ξ", r"\\Xi": "Ξ",
+    r"\\omicron": "ο", r"\\Omicron": "Ο",
+    r"\\pi": "π", r"\\Pi": "Π", r"\\varpi": "ϖ",
+    r"\\rho": "ρ", r"\\Rho": "Ρ", r"\\varrho": "ϱ",
+    r"\\sigma": "σ", r"\\Sigma": "Σ", r"\\varsigma": "ς",
+    r"\\tau": "τ", r"\\Tau": "Τ",
+    r"\\upsilon": "υ", r"\\Upsilon": "Υ",
+    r"\\phi": "φ", r"\\Phi": "Φ", r"\\varphi": "ϕ",
+    r"\\chi": "χ", r"\\Chi": "Χ",
+    r"\\psi": "ψ", r"\\Psi": "Ψ",
+    r"\\omega": "ω", r"\\Omega": "Ω",
+}
+
+# Extended mathematical symbols
+SYMBOLS = {
+    r"\\times": "×", r"\\cdot": "·", r"\\bullet": "•",
+    r"\\leq": "≤", r"\\le": "≤", r"\\geq": "≥", r"\\ge": "≥",
+    r"\\neq": "≠", r"\\ne": "≠", r"\\equiv": "≡",
+    r"\\pm": "±", r"\\mp": "∓",
+    r"\\approx": "≈", r"\\sim": "∼", r"\\simeq": "≃",
+    r"\\propto": "∝", r"\\infty": "∞",
+    r"\\in": "∈", r"\\notin": "∉", r"\\ni": "∋",
+    r"\\subset": "⊂", r"\\supset": "⊃", r"\\subseteq": "⊆", r"\\supseteq": "⊇",
+    r"\\cup": "∪", r"\\cap": "∩", r"\\setminus": "∖",
+    r"\\emptyset": "∅", r"\\varnothing": "∅",
+    r"\\forall": "∀", r"\\exists": "∃", r"\\nexists": "∄",
+    r"\\therefore": "∴", r"\\because": "∵",
+    r"\\sum": "Σ", r"\\prod": "Π", r"\\int": "∫",
+    r"\\partial": "∂", r"\\nabla": "∇",
+    r"\\rightarrow": "→", r"\\to": "→", r"\\leftarrow": "←",
+    r"\\leftrightarrow": "↔", r"\\Rightarrow": "⇒", r"\\Leftarrow": "⇐",
+    r"\\Leftrightarrow": "⇔", r"\\iff": "⇔",
+    r"\\uparrow": "↑", r"\\downarrow": "↓", r"\\updownarrow": "↕",
+}
+
+# Structural regexes compiled once at import; these run per streamed
+# chunk so per-call re-compilation/cache probing adds up
+_FRAC_RE = re.compile(r'\\frac\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}')
+_SQRT_RE = re.compile(r'\\sqrt\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}')
+_SUP_RE = re.compile(r'\^(\w|\{[^}]*\})')
+_SUB_RE = re.compile(r'_(\w|\{[^}]*\})')
+
+# Delimiter pairs scanned by transform_math_regions, in priority
+# order when several open at the same position
+_DELIMITERS = (('\\[', '\\]'), ('\\(', '\\)'), ('$', '$'))
+
+# Single name->replacement map covering Greek letters and symbols; one
+# token pass replaces the ~90 per-symbol re.sub scans. Keys drop the
+# escaped backslash since _TOKEN_RE captures the bare command name.
+_SYMBOL_MAP = {cmd.lstrip('\\'): char
+               for cmd, char in {**GREEK, **SYMBOLS}.items()}
+_TOKEN_RE = re.compile(r'\\([a-zA-Z]+)(\*?)')
+
+# Matches the first math trigger ($, \[ or \() in one C-level scan
+_MATH_FAST_RE = re.compile(r'\$|\\[\[(]')
+
+
+def has_math_content(text: str) -> bool:
+    """Pre-filter: quickly check if text contains math expressions."""
+    if not text:
+        return False
+    return _MATH_FAST_RE.search(text) is not None
+
+
+# Pure function of its input, and streamed renders re-transform the
+# same expressions as the surrounding text grows, so repeats are free
+@functools.lru_cache(maxsize=512)
+def _safe_transform_expr(expr: str) -> str:
+    """Transform LaTeX expression with error handling and enhanced support."""
+    if not expr or not expr.strip():
+        return expr
+
+    try:
+        original_expr = expr
+
+        # Handle nested fractions with improved regex
+        def frac_repl(match):
+            try:
+                num = match.group(1).strip()
+                den = match.group(2).strip()
+                return f"({num})/({den})"
+            except Exception:
+                return match.group(0)  # Return original if parsing fails
+
+        # Process fractions (handles simple nesting)
+        expr = _FRAC_RE.sub(frac_repl, expr)
+
+        # Handle square roots with improved pattern
+        def sqrt_repl(match):
+            try:
+                content = match.group(1).strip()
+                return f"√({content})"
+            except Exception:
+                return match.group(0)
+
+        expr = _SQRT_RE.sub(sqrt_repl, expr)
+
+        # Handle superscripts and subscripts
+        expr = _SUP_RE.sub(lambda m: f"^{m.group(1).strip('{}')}", expr)
+        expr = _SUB_RE.sub(lambda m: f"_{m.group(1).strip('{}')}", expr)
+
+        # Replace Greek letters and symbols (case-sensitive, whole word)
+        # and strip unknown commands in one pass over the expression
+        def token_repl(match):
+            replacement = _SYMBOL_MAP.get(match.group(1))
+            if replacement is None:
+                return ''  # Unknown command - drop it gracefully
+            return replacement + match.group(2)
+
+        expr = _TOKEN_RE.sub(token_repl, expr)
+
+        # Clean up braces and excessive whitespace in one pass; most
+        # expressions need neither, so gate on a cheap substring probe
+        if '{' in expr or '}' in expr or '  ' in expr or '\t' in expr or '\n' in expr:
+            out = []
+            last_space = False
+            for ch in expr:
+                if ch in '{}':
+                    continue
+                if ch in ' \t\n\r':
+                    if not last_space:
+                        out.append(' ')
+                        last_space = True
+                else:
+                    out.append(ch)
+                    last_space = False
+            expr = ''.join(out)
+        expr = expr.strip()
+
+        return expr if expr else original_expr
+
+    except Exception:
+        # If any error occurs, return the original expression
+        return original_expr
+
+
+def transform_math_regions(text: str) -> str:
+    r"""Find and transform math regions with enhanced performance and error handling.
+
+    Processes inline ($...$), display (\[...\]), and parenthesized (\(...\)) math.
+    Includes pre-filtering for performance optimization.
+    """
+    if not text or not has_math_content(text):
+        return text
+
+    try:
+        # Single left-to-right scan: locate the nearest opening
+        # delimiter with C-level str.find, transform the enclosed
+        # region, and copy everything else through untouched. One
+        # pass over the text replaces three regex sub passes, and
+        # unbalanced delimiters simply fall through unchanged.
+        parts = []
+        pos = 0
+        find = text.find
+        while True:
+            start = -1
+            for opener, closer in _DELIMITERS:
+                i = find(opener, pos)
+                if i != -1 and (start == -1 or i < start):
+                    start, open_d, close_d = i, opener, closer
+            if start == -1:
+                break
+            inner_start = start + len(open_d)
+            end = find(close_d, inner_start)
+            if end == -1 or end == inner_start:
+                # No closer (or empty region): emit the opener
+                # literally and keep scanning after it
+                parts.append(text[pos:inner_start])
+                pos = inner_start
+                continue
+            parts.append(text[pos:start])
+            parts.append(_safe_transform_expr(text[inner_start:end]))
+            pos = end + len(close_d)
+        parts.append(text[pos:])
+        return ''.join(parts)
+
+    except Exception:
+        # If any catastrophic error occurs, return original text
+        return text
+
+
+def clean_latex_math(text: str) -> str:
+    """Compatibility wrapper for existing callers.
+
+    Delegates to transform_math_regions which implements the enhanced
+    math transformation with pre-filtering and error handling.
+    """
+    return transform_math_regions(text)
+
 
 class MathFormatter:
     r"""Enhanced math transformer with pre-filtering and robust LaTeX support.
@@ -10,175 +220,15 @@ class MathFormatter:
     1. Pre-checking for math content to skip unnecessary processing
     2. Converting common LaTeX constructs to Unicode/ASCII equivalents
     3. Providing graceful fallbacks for unsupported expressions
+
+    Thin namespace over the module-level functions above, kept for the
+    existing MathFormatter.* call sites.
     """
 
-    # Extended Greek letters support
-    GREEK = {
-        r"\\alpha": "α", r"\\Alpha": "Α",
-        r"\\beta": "β", r"\\Beta": "Β", 
-        r"\\gamma": "γ", r"\\Gamma": "Γ",
-        r"\\delta": "δ", r"\\Delta": "Δ",
-        r"\\epsilon": "ε", r"\\varepsilon": "ε",
-        r"\\zeta": "ζ", r"\\Zeta": "Ζ",
-        r"\\eta": "η", r"\\Eta": "Η",
-        r"\\theta": "θ", r"\\Theta": "Θ", r"\\vartheta": "ϑ",
-        r"\\iota": "ι", r"\\Iota": "Ι",
-        r"\\kappa": "κ", r"\\Kappa": "Κ",
-        r"\\lambda": "λ", r"\\Lambda": "Λ",
-        r"\\mu": "μ", r"\\Mu": "Μ",
-        r"\\nu": "ν", r"\\Nu": "Ν",
-        r"\\xi": "ξ", r"\\Xi": "Ξ",
-        r"\\omicron": "ο", r"\\Omicron": "Ο",
-        r"\\pi": "π", r"\\Pi": "Π", r"\\varpi": "ϖ",
-        r"\\rho": "ρ", r"\\Rho": "Ρ", r"\\varrho": "ϱ",
-        r"\\sigma": "σ", r"\\Sigma": "Σ", r"\\varsigma": "ς",
-        r"\\tau": "τ", r"\\Tau": "Τ",
-        r"\\upsilon": "υ", r"\\Upsilon": "Υ",
-        r"\\phi": "φ", r"\\Phi": "Φ", r"\\varphi": "ϕ",
-        r"\\chi": "χ", r"\\Chi": "Χ",
-        r"\\psi": "ψ", r"\\Psi": "Ψ",
-        r"\\omega": "ω", r"\\Omega": "Ω",
-    }
-
-    # Extended mathematical symbols
-    SYMBOLS = {
-        r"\\times": "×", r"\\cdot": "·", r"\\bullet": "•",
-        r"\\leq": "≤", r"\\le": "≤", r"\\geq": "≥", r"\\ge": "≥",
-        r"\\neq": "≠", r"\\ne": "≠", r"\\equiv": "≡",
-        r"\\pm": "±", r"\\mp": "∓",
-        r"\\approx": "≈", r"\\sim": "∼", r"\\simeq": "≃",
-        r"\\propto": "∝", r"\\infty": "∞",
-        r"\\in": "∈", r"\\notin": "∉", r"\\ni": "∋",
-        r"\\subset": "⊂", r"\\supset": "⊃", r"\\subseteq": "⊆", r"\\supseteq": "⊇",
-        r"\\cup": "∪", r"\\cap": "∩", r"\\setminus": "∖",
-        r"\\emptyset": "∅", r"\\varnothing": "∅",
-        r"\\forall": "∀", r"\\exists": "∃", r"\\nexists": "∄",
-        r"\\therefore": "∴", r"\\because": "∵",
-        r"\\sum": "Σ", r"\\prod": "Π", r"\\int": "∫",
-        r"\\partial": "∂", r"\\nabla": "∇",
-        r"\\rightarrow": "→", r"\\to": "→", r"\\leftarrow": "←",
-        r"\\leftrightarrow": "↔", r"\\Rightarrow": "⇒", r"\\Leftarrow": "⇐",
-        r"\\Leftrightarrow": "⇔", r"\\iff": "⇔",
-        r"\\uparrow": "↑", r"\\downarrow": "↓", r"\\updownarrow": "↕",
-    }
-
-    @staticmethod
-    def has_math_content(text: str) -> bool:
-        """Pre-filter: quickly check if text contains math expressions."""
-        if not text:
-            return False
-        return '$' in text or '\\[' in text or '\\(' in text
-
-    @staticmethod
-    def _safe_transform_expr(expr: str) -> str:
-        """Transform LaTeX expression with error handling and enhanced support."""
-        if not expr or not expr.strip():
-            return expr
-
-        try:
-            original_expr = expr
-            
-            # Handle nested fractions with improved regex
-            def frac_repl(match):
-                try:
-                    num = match.group(1).strip()
-                    den = match.group(2).strip()
-                    return f"({num})/({den})"
-                except Exception:
-                    return match.group(0)  # Return original if parsing fails
-
-            # Process fractions (handles simple nesting)
-            expr = re.sub(r'\\frac\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}', 
-                         frac_repl, expr)
-
-            # Handle square roots with improved pattern
-            def sqrt_repl(match):
-                try:
-                    content = match.group(1).strip()
-                    return f"√({content})"
-                except Exception:
-                    return match.group(0)
-
-            expr = re.sub(r'\\sqrt\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}', sqrt_repl, expr)
-
-            # Handle superscripts and subscripts
-            expr = re.sub(r'\^(\w|\{[^}]*\})', lambda m: f"^{m.group(1).strip('{}')}", expr)
-            expr = re.sub(r'_(\w|\{[^}]*\})', lambda m: f"_{m.group(1).strip('{}')}", expr)
-
-            # Apply Greek letters (case-sensitive, whole word)
-            for latex_cmd, unicode_char in MathFormatter.GREEK.items():
-                expr = re.sub(latex_cmd + r'(?![a-zA-Z])', unicode_char, expr)
-
-            # Apply mathematical symbols (case-sensitive, whole word)
-            for latex_cmd, unicode_char in MathFormatter.SYMBOLS.items():
-                expr = re.sub(latex_cmd + r'(?![a-zA-Z])', unicode_char, expr)
-
-            # Clean up remaining LaTeX commands (remove unknown commands gracefully)
-            expr = re.sub(r'\\[a-zA-Z]+\*?', '', expr)
-
-            # Clean up braces and excessive whitespace
-            expr = re.sub(r'\{([^{}]*)\}', r'\1', expr)  # Remove simple braces
-            expr = re.sub(r'\s+', ' ', expr)  # Collapse whitespace
-            expr = expr.strip()
-
-            return expr if expr else original_expr
-
-        except Exception:
-            # If any error occurs, return the original expression
-            return original_expr
-
-    @staticmethod
-    def transform_math_regions(text: str) -> str:
-        r"""Find and transform math regions with enhanced performance and error handling.
-
-        Processes inline ($...$), display (\[...\]), and parenthesized (\(...\)) math.
-        Includes pre-filtering for performance optimization.
-        """
-        if not text or not MathFormatter.has_math_content(text):
-            return text
-
-        try:
-            # Handle display math \[ ... \] (highest priority)
-            def display_repl(match):
-                try:
-                    inner = match.group(1)
-                    return MathFormatter._safe_transform_expr(inner)
-                except Exception:
-                    return match.group(0)  # Return original on error
-
-            text = re.sub(r'\\\[(.+?)\\\]', display_repl, text, flags=re.DOTALL)
-
-            # Handle parenthesized math \( ... \)
-            def paren_repl(match):
-                try:
-                    inner = match.group(1)
-                    return MathFormatter._safe_transform_expr(inner)
-                except Exception:
-                    return match.group(0)
-
-            text = re.sub(r'\\\((.+?)\\\)', paren_repl, text, flags=re.DOTALL)
-
-            # Handle inline math $...$ (most common, process last to avoid conflicts)
-            def inline_repl(match):
-                try:
-                    inner = match.group(1)
-                    return MathFormatter._safe_transform_expr(inner)
-                except Exception:
-                    return match.group(0)
-
-            text = re.sub(r'\$(.+?)\$', inline_repl, text, flags=re.DOTALL)
-
-            return text
-
-        except Exception:
-            # If any catastrophic error occurs, return original text
-            return text
-
-    @staticmethod
-    def clean_latex_math(text: str) -> str:
-        """Compatibility wrapper for existing callers.
-
-        Delegates to transform_math_regions which implements the enhanced
-        math transformation with pre-filtering and error handling.
-        """
-        return MathFormatter.transform_math_regions(text)
+    GREEK = GREEK
+    SYMBOLS = SYMBOLS
+
+    has_math_content = staticmethod(has_math_content)
+    _safe_transform_expr = staticmethod(_safe_transform_expr)
+    transform_math_regions = staticmethod(transform_math_regions)
+    clean_latex_math = staticmethod(clean_latex_math)
@@ -1,11 +1,64 @@
 """UI panels and components for rich display."""
+import time
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from rich.panel import Panel
 from rich.text import Text
 from rich.markdown import Markdown
 from .formatters import MathFormatter
 from rich.table import Table
-from rich.console import Console
+from rich.console import Console, Group
+
+
+# Markdown parsing (and Pygments lexing of code blocks) is the heavy
+# part of a response panel; refreshes with unchanged content reuse the
+# parsed renderable instead of re-lexing it
+@lru_cache(maxsize=64)
+def _markdown_for(content: str) -> Markdown:
+    return Markdown(content, code_theme="monokai")
+
+
+# Panel titles are constant markup; parse each once instead of on
+# every Panel construction (several per streamed frame)
+_TITLE_REASONING = Text.from_markup("[bold]💭 Reasoning[/bold]")
+_TITLE_RESPONSE = Text.from_markup("[bold]✨ Response[/bold]")
+_TITLE_ERROR = Text.from_markup("[bold]❌ Error[/bold]")
+
+
+@lru_cache(maxsize=16)
+def _info_title(title: str) -> Text:
+    return Text.from_markup(f"[bold]ℹ️ {title}[/bold]")
+
+
+# These panels are deterministic (and usually constant), so build each
+# variant once instead of re-parsing their markup per display
+@lru_cache(maxsize=8)
+def _tools_panel(tool_count: int) -> Panel:
+    tools_text = f"🔧 {tool_count} AI Tool(s) Used:\n"
+    tools_text += "• The AI automatically used web search and/or code execution\n"
+    tools_text += "• This enables real-time information and calculations"
+
+    return Panel(
+        Text(tools_text, style="blue"),
+        title="[bold]🚀 AI Tools Executed[/bold]",
+        border_style="blue",
+        padding=(1, 2)
+    )
+
+
+@lru_cache(maxsize=1)
+def _compound_info_panel() -> Panel:
+    return Panel(
+        Text("🔧 Compound AI Model Active\n" +
+             "This model can automatically:\n" +
+             "• Search the web for real-time information\n" +
+             "• Execute Python code for calculations\n" +
+             "• Access current data beyond training cutoff",
+             style="cyan"),
+        title="[bold]🚀 Enhanced AI Capabilities[/bold]",
+        border_style="cyan",
+        padding=(1, 2)
+    )
 
 
 class PanelFactory:
@@ -14,22 +67,30 @@ class PanelFactory:
     def __init__(self, console: Console, max_height: int = 10):
         self.console = console
         self.max_height = max_height
+        self._last_render_ns = 0
+
+    def should_render(self, min_interval_ns: int = 33_000_000) -> bool:
+        """Rate-gate panel rebuilds to roughly 30fps.
+
+        Streamed tokens arrive far faster than the terminal can usefully
+        repaint; callers skip rebuilding panels when this returns False
+        and emit one final frame when the stream ends.
+        """
+        now = time.monotonic_ns()
+        if now - self._last_render_ns < min_interval_ns:
+            return False
+        self._last_render_ns = now
+        return True
     
     def create_reasoning_panel(self, reasoning: str) -> Panel:
         """Create panel for reasoning content."""
         if not reasoning or not reasoning.strip():
             return None
         
-        # Clean and prepare reasoning text
-        reasoning_text = reasoning.strip()
-        lines = reasoning_text.split('\n')
-        
         # Don't truncate reasoning - show it all
-        display_text = '\n'.join(lines)
-        
         return Panel(
-            Text(display_text, style="yellow"),
-            title="[bold]💭 Reasoning[/bold]",
+            Text(reasoning.strip(), style="yellow"),
+            title=_TITLE_REASONING,
             border_style="yellow",
             padding=(1, 2)
         )
@@ -42,17 +103,31 @@ class PanelFactory:
         safe_content = MathFormatter.transform_math_regions(content)
 
         return Panel(
-            Markdown(safe_content, code_theme="monokai"),
-            title="[bold]✨ Response[/bold]",
+            _markdown_for(safe_content),
+            title=_TITLE_RESPONSE,
             border_style="green",
             padding=(1, 2)
         )
     
+    def update_reasoning_panel(self, panel: Panel, reasoning: str) -> None:
+        """Update an existing reasoning panel in place with new content."""
+        panel.renderable = Text(reasoning.strip(), style="yellow")
+
+    def update_response_panel(self, panel: Panel, content: str) -> None:
+        """Update an existing response panel in place with new content."""
+        safe_content = MathFormatter.transform_math_regions(content)
+        panel.renderable = _markdown_for(safe_content)
+
+    def render_batch(self, *panels: Optional[Panel]) -> Group:
+        """Group panels into one renderable so callers emit a single
+        update per stream tick instead of one print per panel."""
+        return Group(*[panel for panel in panels if panel])
+
     def create_error_panel(self, error: str) -> Panel:
         """Create panel for error messages."""
         return Panel(
             Text(error, style="red"),
-            title="[bold]❌ Error[/bold]",
+            title=_TITLE_ERROR,
             border_style="red",
             padding=(1, 2)
         )
@@ -61,45 +136,31 @@ class PanelFactory:
         """Create panel for informational messages."""
         return Panel(
             Text(message, style="cyan"),
-            title=f"[bold]ℹ️ {title}[/bold]",
+            title=_info_title(title),
             border_style="cyan",
             padding=(1, 2)
         )
     
     def create_tools_panel(self, tool_count: int) -> Panel:
         """Create panel showing AI tools usage."""
-        tools_text = f"🔧 {tool_count} AI Tool(s) Used:\n"
-        tools_text += "• The AI automatically used web search and/or code execution\n"
-        tools_text += "• This enables real-time information and calculations"
-        
-        return Panel(
-            Text(tools_text, style="blue"),
-            title="[bold]🚀 AI Tools Executed[/bold]",
-            border_style="blue",
-            padding=(1, 2)
-        )
-    
+        return _tools_panel(tool_count)
+
     def create_compound_info_panel(self) -> Panel:
         """Create panel showing compound AI capabilities."""
-        return Panel(
-            Text("🔧 Compound AI Model Active\n" +
-                 "This model can automatically:\n" +
-                 "• Search the web for real-time information\n" +
-                 "• Execute Python code for calculations\n" +
-                 "• Access current data beyond training cutoff", 
-                 style="cyan"),
-            title="[bold]🚀 Enhanced AI Capabilities[/bold]",
-            border_style="cyan",
-            padding=(1, 2)
-        )
+        return _compound_info_panel()
 
 
 class TableFactory:
     """Factory for creating styled tables."""
-    
-    @staticmethod
-    def create_help_table() -> Table:
+
+    # The help table is static; built on first use and reused
+    _help_table: Optional[Table] = None
+
+    @classmethod
+    def create_help_table(cls) -> Table:
         """Create help commands table."""
+        if cls._help_table is not None:
+            return cls._help_table
         table = Table(title="[bold]🤖 GPT CLI Commands[/bold]")
         table.add_column("Command", style="cyan", no_wrap=True)
         table.add_column("Description", style="magenta")
@@ -124,21 +185,35 @@ class TableFactory:
         
         for command, description in commands:
             table.add_row(command, description)
-        
+
+        cls._help_table = table
         return table
     
-    @staticmethod
-    def create_history_table(messages: List[Dict[str, str]]) -> Table:
+    # Truncated rows keyed by message identity; the content reference is
+    # kept alongside so a recycled id() can never serve a stale row
+    _row_cache: Dict[int, tuple] = {}
+
+    @classmethod
+    def create_history_table(cls, messages: List[Dict[str, str]]) -> Table:
         """Create conversation history table."""
         table = Table(title="[bold]📜 Conversation History[/bold]")
         table.add_column("Role", style="cyan", no_wrap=True)
         table.add_column("Content", style="white", max_width=80)
-        
+
+        cache = cls._row_cache
+        if len(cache) > 1024:
+            cache.clear()
         for msg in messages:
-            role = msg["role"].capitalize()
-            content = msg["content"][:200] + "..." if len(msg["content"]) > 200 else msg["content"]
-            table.add_row(role, content)
-        
+            content = msg["content"]
+            cached = cache.get(id(msg))
+            if cached is not None and cached[0] is content:
+                role, truncated = cached[1], cached[2]
+            else:
+                role = msg["role"].capitalize()
+                truncated = content[:200] + "..." if len(content) > 200 else content
+                cache[id(msg)] = (content, role, truncated)
+            table.add_row(role, truncated)
+
         return table
     
     @staticmethod
@@ -2,20 +2,35 @@
 
 import sys
 from typing import List, Dict, Callable, Optional, Tuple
-from prompt_toolkit import Application
-from prompt_toolkit.buffer import Buffer
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.layout.containers import HSplit, Window
-from prompt_toolkit.layout.controls import BufferControl, FormattedTextControl
-from prompt_toolkit.layout.layout import Layout
 from rich.console import Console
 import re
 
+# prompt_toolkit costs tens of ms to import and is only needed once the
+# palette actually opens, so it is imported inside the builder methods
+# below rather than at module (and thus CLI startup) time.
+
+
+def _char_mask(text: str) -> int:
+    """Fold a string's characters into a 64-bit membership mask.
+
+    Bits may collide, so the mask can claim characters the string lacks
+    (harmless: the scorer still rejects), but never the reverse - making
+    it a safe prefilter for "does every pattern char appear somewhere".
+    """
+    mask = 0
+    for ch in text:
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
 
 class CommandPaletteItem:
     """Represents a command in the palette."""
-    
-    def __init__(self, name: str, description: str, action: Callable, 
+
+    __slots__ = ('name', 'description', 'action', 'category', 'keybinding',
+                 'display_text', 'row_plain', 'row_selected', 'name_lower',
+                 'description_lower', 'category_lower', 'char_mask')
+
+    def __init__(self, name: str, description: str, action: Callable,
                  category: str = "General", keybinding: str = None):
         self.name = name
         self.description = description
@@ -25,6 +40,17 @@ class CommandPaletteItem:
         self.display_text = f"{name} - {description}"
         if keybinding:
             self.display_text += f" ({keybinding})"
+        # Lowercased once here so the matcher doesn't re-casefold every
+        # field of every item on each keystroke
+        self.name_lower = name.lower()
+        self.description_lower = description.lower()
+        self.category_lower = category.lower()
+        self.char_mask = _char_mask(
+            self.name_lower + self.description_lower + self.category_lower)
+        # Both render variants of this item's palette row, built once so
+        # the display loop avoids per-frame string formatting
+        self.row_plain = f"  {name}\n"
+        self.row_selected = f"► {name}\n"
 
 
 class FuzzyMatcher:
@@ -33,22 +59,31 @@ class FuzzyMatcher:
     @staticmethod
     def score_match(pattern: str, text: str) -> int:
         """Score how well pattern matches text. Higher score = better match."""
+        return FuzzyMatcher._score_lower(pattern.lower(), text.lower())
+
+    @staticmethod
+    def _score_lower(pattern: str, text: str,
+                     boundary: Optional[Tuple[str, str]] = None) -> int:
+        """Score pre-lowercased pattern against pre-lowercased text.
+
+        boundary optionally carries the precomputed (" "+pattern,
+        "-"+pattern) pair so batch callers don't reallocate it per item.
+        """
         if not pattern:
             return 100  # Empty pattern matches everything
-        
-        pattern = pattern.lower()
-        text = text.lower()
-        
+
         # Exact match gets highest score
         if pattern == text:
             return 1000
-        
+
         # Start match gets high score
         if text.startswith(pattern):
             return 900
-        
+
         # Word boundary match
-        if f" {pattern}" in text or f"-{pattern}" in text:
+        if boundary is None:
+            boundary = (" " + pattern, "-" + pattern)
+        if boundary[0] in text or boundary[1] in text:
             return 800
         
         # Contains match
@@ -74,15 +109,31 @@ class FuzzyMatcher:
     def filter_and_sort(pattern: str, items: List[CommandPaletteItem]) -> List[CommandPaletteItem]:
         """Filter and sort items based on fuzzy matching."""
         scored_items = []
-        
+        pattern = pattern.lower()
+        pattern_mask = _char_mask(pattern)
+        # Word-boundary probes built once per keystroke, not per item
+        boundary = (" " + pattern, "-" + pattern)
+        score = FuzzyMatcher._score_lower
+
         for item in items:
-            # Check both name and description
-            name_score = FuzzyMatcher.score_match(pattern, item.name)
-            desc_score = FuzzyMatcher.score_match(pattern, item.description) // 2
-            category_score = FuzzyMatcher.score_match(pattern, item.category) // 3
-            
+            # Every positive score needs all pattern chars to occur in
+            # some field; one mask test rejects most items outright
+            if pattern_mask & ~item.char_mask:
+                continue
+
+            # Check the name first; an exact or prefix hit already beats
+            # anything description/category can contribute (capped at
+            # 500 and 333 by their divisors), so skip scoring them
+            name_score = score(pattern, item.name_lower, boundary)
+            if name_score >= 900:
+                scored_items.append((name_score, item))
+                continue
+
+            desc_score = score(pattern, item.description_lower, boundary) // 2
+            category_score = score(pattern, item.category_lower, boundary) // 3
+
             max_score = max(name_score, desc_score, category_score)
-            
+
             if max_score > 0:
                 scored_items.append((max_score, item))
         
@@ -101,10 +152,25 @@ class CommandPalette:
         self.items: List[CommandPaletteItem] = []
         self.filtered_items: List[CommandPaletteItem] = []
         self.selected_index = 0
-        self.app: Optional[Application] = None
+        # Bumped whenever filtered_items is rebuilt; keys the render cache
+        self._filter_generation = 0
+        self._display_cache: Tuple[Optional[Tuple[int, int]], List[Tuple[str, str]]] = (None, [])
         
-        # Initialize with default commands
+        # Initialize with default commands; handler-provided commands
+        # are added lazily on first show()
         self._register_default_commands()
+        self._dynamic_registered = False
+
+        # Stack of (search_text, result) pairs; extending a search can
+        # only narrow its result, so each keystroke filters the previous
+        # result instead of rescanning every registered item
+        self._filter_stack: List[Tuple[str, List[CommandPaletteItem]]] = [("", self.items)]
+
+        # prompt_toolkit machinery (layout, buffer, bindings, app) is
+        # expensive to assemble; built lazily by the first show() and
+        # re-run on every open after that
+        self.app = None
+        self._search_buffer = None
     
     def _register_default_commands(self):
         """Register default commands available in the palette."""
@@ -138,9 +204,16 @@ class CommandPalette:
                         lambda: self._execute_thinking_toggle(), "Quick Actions")
         
         # System commands
-        self.add_command("exit", "Exit the application", 
+        self.add_command("exit", "Exit the application",
                         lambda: self._exit_app(), "System", "Ctrl+Q")
-        
+
+    def _register_dynamic_commands(self):
+        """Pull commands from the CLI's command handler.
+
+        Runs on the first show() rather than at construction so palette
+        setup stays off the CLI startup path; the result is kept for
+        every later open.
+        """
         # Add commands from command handler if available
         try:
             if hasattr(self.cli, 'command_handler') and hasattr(self.cli.command_handler, 'commands'):
@@ -198,34 +271,78 @@ Type [cyan]help[/cyan] for available commands."""
 
     def _update_filtered_items(self, search_text: str):
         """Update the filtered items based on search text."""
-        if not search_text.strip():
+        search_text = search_text.strip()
+        if not search_text:
             self.filtered_items = self.items[:]
+            self._filter_stack = [("", self.items)]
         else:
-            self.filtered_items = FuzzyMatcher.filter_and_sort(search_text, self.items)
-        
+            # Pop back to the longest previous search this one extends
+            # (handles backspace and mid-edit rewrites), then rescore
+            # only its result set - a superset of the new result
+            stack = self._filter_stack
+            while len(stack) > 1 and not search_text.startswith(stack[-1][0]):
+                stack.pop()
+            self.filtered_items = FuzzyMatcher.filter_and_sort(
+                search_text, stack[-1][1])
+            stack.append((search_text, self.filtered_items))
+
         # Reset selection
         self.selected_index = 0
+        self._filter_generation += 1
     
     def _get_display_text(self) -> List[Tuple[str, str]]:
         """Get formatted text for display."""
         if not self.filtered_items:
             return [("class:no-results", "No matching commands found")]
-        
+
+        # Only format a terminal-height window around the selection; a
+        # long command list shouldn't cost O(total) per repaint
+        height = max(8, self.console.size.height - 4)
+
+        # prompt_toolkit calls this on every invalidation; reuse the last
+        # frame when neither the filter result nor the selection changed
+        key = (self._filter_generation, self.selected_index, height)
+        if self._display_cache[0] == key:
+            return self._display_cache[1]
+
+        items = self.filtered_items
+        selected = self.selected_index
+        start = max(0, selected - height // 2)
+        end = min(len(items), start + height)
+        start = max(0, end - height)
+
         lines = []
-        
+
         # Simple vertical list of commands - each on its own line
-        for i, item in enumerate(self.filtered_items):
-            prefix = "► " if i == self.selected_index else "  "
-            style = "class:selected-item" if i == self.selected_index else "class:item"
-            
-            # Just show the command name with explicit newline
-            display_line = f"{prefix}{item.name}\n"
-            lines.append((style, display_line))
-        
+        for i in range(start, end):
+            if i == selected:
+                lines.append(("class:selected-item", items[i].row_selected))
+            else:
+                lines.append(("class:item", items[i].row_plain))
+
+        self._display_cache = (key, lines)
         return lines
     
+    def _build_app(self):
+        """Assemble the prompt_toolkit Application on first use."""
+        from prompt_toolkit import Application
+
+        layout, self._search_buffer = self._create_layout()
+        kb = self._create_key_bindings(self._search_buffer)
+        self.app = Application(
+            layout=layout,
+            key_bindings=kb,
+            full_screen=False,  # Don't take over entire screen
+            mouse_support=False,  # Disable mouse in inline mode
+        )
+
     def _create_layout(self):
         """Create the layout for the command palette."""
+        from prompt_toolkit.buffer import Buffer
+        from prompt_toolkit.layout.containers import HSplit, Window
+        from prompt_toolkit.layout.controls import BufferControl, FormattedTextControl
+        from prompt_toolkit.layout.layout import Layout
+
         # Search buffer
         search_buffer = Buffer(
             on_text_changed=lambda buf: self._update_filtered_items(buf.text),
@@ -254,6 +371,8 @@ Type [cyan]help[/cyan] for available commands."""
     
     def _create_key_bindings(self, search_buffer):
         """Create key bindings for the command palette."""
+        from prompt_toolkit.key_binding import KeyBindings
+
         kb = KeyBindings()
         
         @kb.add('escape')
@@ -321,55 +440,52 @@ Type [cyan]help[/cyan] for available commands."""
         
         return kb
     
+    def _clear_palette_display(self):
+        """Erase the palette's lines from the terminal.
+
+        The cursor-up and clear-to-end sequences are emitted as one write
+        so the terminal never renders a half-cleared frame between
+        syscalls.
+        """
+        # Calculate how many lines the palette used (capped by the
+        # display window; the "no results" row still occupies one line)
+        visible = min(len(self.filtered_items),
+                      max(8, self.console.size.height - 4)) or 1
+        num_palette_lines = visible + 2  # items + search line + buffer
+        seq = b"\x1b[%dA\x1b[J" % num_palette_lines  # Move up + clear
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is not None:
+            buffer.write(seq)
+            buffer.flush()
+        else:
+            # stdout without a binary layer (e.g. captured/replaced)
+            sys.stdout.write(seq.decode('ascii'))
+            sys.stdout.flush()
+
     def show(self) -> Optional[CommandPaletteItem]:
         """Show the command palette and return the selected command."""
-        # Initialize filtered items
+        if not self._dynamic_registered:
+            self._register_dynamic_commands()
+            self._dynamic_registered = True
+
+        if self.app is None:
+            self._build_app()
+
+        # Reset search state; the Application itself is reused
+        self._search_buffer.reset()
         self._update_filtered_items("")
-        
-        # Create layout
-        layout, search_buffer = self._create_layout()
-        
-        # Create key bindings
-        kb = self._create_key_bindings(search_buffer)
-        
-        # Create application
-        self.app = Application(
-            layout=layout,
-            key_bindings=kb,
-            full_screen=False,  # Don't take over entire screen
-            mouse_support=False,  # Disable mouse in inline mode
-        )
-        
-        # Define styles
-        style_dict = {
-            'category-header': '#ansiblue bold',
-            'selected-item': '#ansigreen bg:#ansiblack',
-            'item': '#ansiwhite',
-            'no-results': '#ansiyellow italic',
-        }
-        
+
         try:
             # Run the application
             result = self.app.run()
-            
+
             # Always clear the palette display (whether command selected or cancelled)
-            # Calculate how many lines the palette used
-            num_palette_lines = len(self.filtered_items) + 2  # items + search line + buffer
-            
-            # Move cursor up to where the search started
-            import sys
-            sys.stdout.write(f"\033[{num_palette_lines}A")  # Move up
-            sys.stdout.write("\033[J")  # Clear from cursor to end of screen
-            sys.stdout.flush()
-            
+            self._clear_palette_display()
+
             return result
         except KeyboardInterrupt:
             # Clean up on Ctrl+C as well
-            num_palette_lines = len(self.filtered_items) + 2
-            import sys
-            sys.stdout.write(f"\033[{num_palette_lines}A")
-            sys.stdout.write("\033[J")
-            sys.stdout.flush()
+            self._clear_palette_display()
             return None
         finally:
             # Don't clear screen - preserve existing content
@@ -1,14 +1,30 @@
 """Refactored command system for better maintainability."""
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
-from rich.console import Console
+
+# One Console for all commands, built on first print: construction
+# probes the terminal and color system, and importing rich pulls in
+# pygments - neither is needed just to classify or dispatch input
+_shared_console = None
+
+
+def _get_console():
+    global _shared_console
+    if _shared_console is None:
+        from rich.console import Console
+        _shared_console = Console()
+    return _shared_console
+
 
 class Command(ABC):
     """Base class for all commands."""
-    
+
     def __init__(self, cli_instance):
         self.cli = cli_instance
-        self.console = Console()
+
+    @property
+    def console(self):
+        return _get_console()
     
     @abstractmethod
     def execute(self, args: str) -> Optional[str]:
@@ -26,13 +42,13 @@ class ModelCommand(Command):
     """Switch between different AI models."""
     
     def execute(self, args: str) -> Optional[str]:
-        if not args.strip():
+        args = args.strip()
+        if not args:
             # Reset to default
             self.cli.current_model = self.cli.config.get('default_model')
             self.console.print(f"[green]✅ Reset to default model: {self.cli.current_model}[/green]")
         else:
-            model_name = args.strip()
-            self.cli.switch_model(model_name)
+            self.cli.switch_model(args)
         return None
     
     def get_help(self) -> str:
@@ -74,11 +90,12 @@ class ListCommand(Command):
     """List available models or show system information."""
     
     def execute(self, args: str) -> Optional[str]:
-        if not args.strip():
+        args = args.strip()
+        if not args:
             # Default: list models
             self._list_models()
         else:
-            arg = args.strip().lower()
+            arg = args.lower()
             if arg == "models":
                 self._list_models()
             else:
@@ -113,11 +130,11 @@ class TemplateCommand(Command):
     """Show common prompt templates and examples."""
     
     def execute(self, args: str) -> Optional[str]:
-        if not args.strip():
+        args = args.strip()
+        if not args:
             self._show_templates()
         else:
-            template_name = args.strip().lower()
-            self._show_specific_template(template_name)
+            self._show_specific_template(args.lower())
         return None
     
     def _show_templates(self):
@@ -141,9 +158,9 @@ class TemplateCommand(Command):
         
         self.console.print(templates_text)
     
-    def _show_specific_template(self, template_name: str):
-        """Show specific template examples."""
-        templates = {
+    # Template bodies are static; build the table once at class
+    # definition instead of per lookup
+    _TEMPLATES = {
             "code": """[bold cyan]Code Templates:[/bold cyan]
 
 • "Review this code for bugs and improvements: [paste code]"
@@ -187,10 +204,13 @@ class TemplateCommand(Command):
 • "Summarize the key points about: [topic]"
 • "Find credible sources about: [research topic]"
 """
-        }
-        
-        if template_name in templates:
-            self.console.print(templates[template_name])
+    }
+
+    def _show_specific_template(self, template_name: str):
+        """Show specific template examples."""
+        template = self._TEMPLATES.get(template_name)
+        if template is not None:
+            self.console.print(template)
         else:
             self.console.print(f"[red]Template '{template_name}' not found.[/red]")
             self.console.print("Use [cyan]template[/cyan] to see available templates.")
@@ -216,23 +236,39 @@ class CommandHandler:
         }
         
         # NOTE: Command palette is accessed via "/" key - no need for separate command
-    
+
+        # Frozen name set for the per-line membership tests
+        self._command_names = frozenset(self.commands)
+
+        # Help text is static per command; collect it once up front
+        self._command_list = {name: cmd.get_help()
+                              for name, cmd in self.commands.items()}
+
+    @staticmethod
+    def _parse(user_input: str) -> tuple:
+        """Split input into (lowered command, args) without allocating a list.
+
+        partition instead of split: no list allocation per input line.
+        Shared by execute and is_command so both parse identically.
+        """
+        command, _, args = user_input.strip().partition(' ')
+        return command.lower(), args
+
     def execute(self, user_input: str) -> Optional[str]:
         """Execute a command and return any template or None."""
-        parts = user_input.strip().split(' ', 1)
-        command = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
-        
-        if command in self.commands:
-            return self.commands[command].execute(args)
-        
+        command, args = self._parse(user_input)
+
+        # Single .get probe instead of `in` + `[]` (two lookups)
+        cmd = self.commands.get(command)
+        if cmd is not None:
+            return cmd.execute(args)
+
         return None  # Not a command, treat as regular input
-    
+
     def is_command(self, user_input: str) -> bool:
         """Check if input is a command."""
-        command = user_input.strip().split(' ', 1)[0].lower()
-        return command in self.commands
+        return self._parse(user_input)[0] in self._command_names
     
     def get_command_list(self) -> Dict[str, str]:
         """Get list of commands with their help text."""
-        return {name: cmd.get_help() for name, cmd in self.commands.items()}
+        return self._command_list
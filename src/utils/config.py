@@ -1,25 +1,47 @@
 """Configuration management for GPT CLI."""
+import json
 import os
 from typing import Dict, Any
 
+# Prefer orjson when available, mirroring models.conversation; config
+# files are small so this mostly trims startup and save latency.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+
+# Truthy spellings accepted for boolean env vars
+_TRUE = frozenset({'true', '1', 'yes', 'on'})
+
+
 class Config:
     """Configuration class for GPT CLI settings."""
-    
+
     def __init__(self):
+        # Bind os.environ once; os.getenv re-resolves it per call
+        env = os.environ.get
         self.settings = {
-            'api_key': os.getenv('GROQ_API_KEY', ''),
-            'default_model': os.getenv('GPT_DEFAULT_MODEL', 'openai/gpt-oss-20b'),
-            'max_tokens': int(os.getenv('GPT_MAX_TOKENS', '8192')),
-            'temperature': float(os.getenv('GPT_TEMPERATURE', '1.0')),
-            'save_history': os.getenv('GPT_SAVE_HISTORY', 'true').lower() == 'true',
-            'history_file': os.getenv('GPT_HISTORY_FILE', 'conversation_history.json'),
-            'retry_attempts': int(os.getenv('GPT_RETRY_ATTEMPTS', '3')),
-            'timeout': int(os.getenv('GPT_TIMEOUT', '30')),
-            'reasoning_effort': os.getenv('GPT_REASONING_EFFORT', 'medium'),
-            'include_reasoning': os.getenv('GPT_INCLUDE_REASONING', 'true').lower() == 'true',
-            'show_reasoning_panel': os.getenv('GPT_SHOW_REASONING_PANEL', 'false').lower() == 'true',
-            'clear_on_start': os.getenv('GPT_CLEAR_ON_START', 'true').lower() == 'true',
-            'thinking_mode': os.getenv('GPT_THINKING_MODE', 'normal'),
+            'api_key': env('GROQ_API_KEY', ''),
+            'default_model': env('GPT_DEFAULT_MODEL', 'openai/gpt-oss-20b'),
+            'max_tokens': int(env('GPT_MAX_TOKENS', '8192')),
+            'temperature': float(env('GPT_TEMPERATURE', '1.0')),
+            'save_history': env('GPT_SAVE_HISTORY', 'true').lower() in _TRUE,
+            'history_file': env('GPT_HISTORY_FILE', 'conversation_history.json'),
+            'retry_attempts': int(env('GPT_RETRY_ATTEMPTS', '3')),
+            'timeout': int(env('GPT_TIMEOUT', '30')),
+            'reasoning_effort': env('GPT_REASONING_EFFORT', 'medium'),
+            'include_reasoning': env('GPT_INCLUDE_REASONING', 'true').lower() in _TRUE,
+            'show_reasoning_panel': env('GPT_SHOW_REASONING_PANEL', 'false').lower() in _TRUE,
+            'clear_on_start': env('GPT_CLEAR_ON_START', 'true').lower() in _TRUE,
+            'thinking_mode': env('GPT_THINKING_MODE', 'normal'),
         }
         
         # Valid options
@@ -49,9 +71,8 @@ class Config:
     def load_from_file(self, filepath: str) -> None:
         """Load configuration from JSON file."""
         try:
-            import json
-            with open(filepath, 'r') as f:
-                file_config = json.load(f)
+            with open(filepath, 'rb') as f:
+                file_config = _loads(f.read())
                 # Merge top-level settings
                 self.settings.update(file_config)
                 # If nested UI settings exist, promote recognized keys
@@ -64,15 +85,13 @@ class Config:
     
     def save_to_file(self, filepath: str) -> None:
         """Save configuration to JSON file."""
-        import json
-        
         # Create a copy of settings for saving
         save_data = self.settings.copy()
         
         # If the file already exists, preserve its structure
         try:
-            with open(filepath, 'r') as f:
-                existing_config = json.load(f)
+            with open(filepath, 'rb') as f:
+                existing_config = _loads(f.read())
                 
             # Update the existing structure instead of replacing it
             existing_config.update(save_data)
@@ -81,12 +100,13 @@ class Config:
             if 'ui' in existing_config and isinstance(existing_config['ui'], dict):
                 save_data = existing_config
             
-        except (FileNotFoundError, json.JSONDecodeError):
+        except (FileNotFoundError, ValueError):
             # If file doesn't exist or is corrupted, create new structure
+            # (both json and orjson decode errors subclass ValueError)
             pass
-        
-        with open(filepath, 'w') as f:
-            json.dump(save_data, f, indent=2)
+
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(save_data))
     
     def toggle_thinking_mode(self) -> str:
         """Toggle between 'normal' and 'hard' thinking modes."""
@@ -22,8 +22,14 @@ class RetryHandler:
             except (requests.RequestException, ConnectionError, TimeoutError) as e:
                 last_exception = e
                 if attempt < self.max_retries - 1:
-                    delay = self.base_delay * (2 ** attempt)
-                    self.console.print(f"[yellow]Connection failed, retrying in {delay:.1f}s... (attempt {attempt + 1}/{self.max_retries})[/yellow]")
+                    # Shift instead of 2 ** attempt for the doubling
+                    delay = self.base_delay * (1 << attempt)
+                    # Only probe connectivity once a call has actually
+                    # failed, to pick the right user-facing message
+                    if self.console.is_terminal:
+                        if not NetworkChecker.is_connected():
+                            self.console.print("[yellow]No internet connection detected. Check your network.[/yellow]")
+                        self.console.print(f"[yellow]Connection failed, retrying in {delay:.1f}s... (attempt {attempt + 1}/{self.max_retries})[/yellow]")
                     time.sleep(delay)
                 else:
                     self.console.print(f"[red]Failed after {self.max_retries} attempts.[/red]")
@@ -39,12 +45,27 @@ class RetryHandler:
 
 class NetworkChecker:
     """Check network connectivity."""
-    
-    @staticmethod
-    def is_connected(url: str = "https://api.groq.com", timeout: int = 5) -> bool:
+
+    # Probe results are reused for a few seconds; back-to-back retries
+    # don't need to re-hit the endpoint
+    _CACHE_TTL = 5.0
+    _cached_at = 0.0
+    _cached_result = False
+
+    @classmethod
+    def is_connected(cls, url: str = "https://api.groq.com", timeout: int = 5) -> bool:
         """Check if we can reach the API endpoint."""
+        now = time.monotonic()
+        if now - cls._cached_at < cls._CACHE_TTL:
+            return cls._cached_result
+
         try:
-            response = requests.get(url, timeout=timeout)
-            return response.status_code < 500
-        except:
-            return False
+            # HEAD skips the response body; only reachability matters
+            response = requests.head(url, timeout=timeout, allow_redirects=False)
+            result = response.status_code < 500
+        except requests.RequestException:
+            result = False
+
+        cls._cached_at = now
+        cls._cached_result = result
+        return result
@@ -0,0 +1,291 @@
+"""File management for conversation persistence and export."""
+import codecs
+import os
+import json
+from typing import Dict, Any, List, Optional
+
+from models.conversation import Conversation
+
+# Per-role display constants for the exporters, computed once at import
+# instead of branching and calling str.title() per message.
+_ROLE_EMOJI = {'user': '🧑', 'assistant': '🤖'}
+
+# Text document formats accepted for loading into a prompt
+_SUPPORTED_EXTS = frozenset({
+    '.txt', '.md', '.markdown', '.json', '.py', '.log', '.csv',
+})
+_ROLE_TITLE = {'user': 'User', 'assistant': 'Assistant'}
+_ROLE_UPPER = {'user': 'USER', 'assistant': 'ASSISTANT'}
+
+
+class FileManager:
+    """Manages conversation files on disk: save, load, list, and export."""
+
+    # Header fields are written at the start of files produced by
+    # save_conversation, so a bounded prefix is enough to recover them
+    # without parsing the whole document.
+    _HEADER_PREFIX_BYTES = 4096
+
+    # Sidecar index file caching parsed headers keyed by filename
+    _INDEX_NAME = '.index.json'
+
+    def __init__(self, conversations_dir: str = "conversations"):
+        self.conversations_dir = conversations_dir
+        self._index_path = os.path.join(conversations_dir, self._INDEX_NAME)
+        self._header_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Lazily load the sidecar header index from disk."""
+        if self._header_cache is None:
+            try:
+                with open(self._index_path, 'r', encoding='utf-8') as f:
+                    self._header_cache = json.load(f)
+            except (OSError, ValueError):
+                self._header_cache = {}
+        return self._header_cache
+
+    def _save_index(self) -> None:
+        """Persist the header index atomically."""
+        tmp_path = self._index_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._header_cache, f)
+            os.replace(tmp_path, self._index_path)
+        except OSError:
+            pass
+
+    def _ensure_dir(self) -> None:
+        """Create the conversations directory if it doesn't exist."""
+        os.makedirs(self.conversations_dir, exist_ok=True)
+
+    def save_conversation(self, conversation: Conversation,
+                          filename: Optional[str] = None) -> str:
+        """Save a conversation and return the path written.
+
+        Writes to a temp file and os.replace()s it into place so that
+        list_conversations never observes a partially written file.
+        """
+        self._ensure_dir()
+        filename = filename or f"{conversation.session_id}.json"
+        filepath = os.path.join(self.conversations_dir, filename)
+        tmp_path = filepath + '.tmp'
+        conversation.save_to_file(tmp_path)
+        os.replace(tmp_path, filepath)
+        return filepath
+
+    def load_conversation(self, filename: str) -> Conversation:
+        """Load a conversation by path or by filename in the conversations dir.
+
+        Opens directly and falls back on FileNotFoundError rather than
+        paying a separate existence check before every open.
+        """
+        try:
+            return Conversation.load_from_file(filename)
+        except FileNotFoundError:
+            return Conversation.load_from_file(
+                os.path.join(self.conversations_dir, filename))
+
+    @staticmethod
+    def _read_header(filepath: str) -> Dict[str, Any]:
+        """Stream-parse only the header fields and message count of a file.
+
+        Scalar fields are pulled from a bounded prefix with raw_decode;
+        messages are counted by scanning for their role keys chunk by
+        chunk instead of materializing the full message list.
+        """
+        header: Dict[str, Any] = {
+            'session_id': None,
+            'created_at': None,
+            'model': None,
+        }
+        decoder = json.JSONDecoder()
+        message_count = 0
+
+        with open(filepath, 'rb', buffering=131072) as f:
+            prefix = f.read(FileManager._HEADER_PREFIX_BYTES)
+            text = prefix.decode('utf-8', errors='ignore')
+            for key in ('session_id', 'created_at', 'model'):
+                marker = f'"{key}":'
+                idx = text.find(marker)
+                if idx != -1:
+                    try:
+                        value, _ = decoder.raw_decode(
+                            text[idx + len(marker):].lstrip())
+                        header[key] = value
+                    except ValueError:
+                        pass
+
+            # Count messages without building them: each message object
+            # carries exactly one "role" key, and quotes inside message
+            # content are JSON-escaped so they can't false-match.
+            needle = b'"role"'
+            tail = b''
+            chunk = prefix
+            while chunk:
+                data = tail + chunk
+                message_count += data.count(needle)
+                tail = data[-(len(needle) - 1):]
+                chunk = f.read(65536)
+
+        header['message_count'] = message_count
+        return header
+
+    def list_conversations(self) -> List[Dict[str, Any]]:
+        """List saved conversations with their header metadata.
+
+        Reads only file headers instead of fully parsing each document.
+        """
+        if not os.path.isdir(self.conversations_dir):
+            return []
+
+        conversations = []
+        cache = self._load_index()
+        cache_dirty = False
+        seen = set()
+        # os.scandir yields cached stat/type info per entry, avoiding the
+        # extra stat syscalls that os.listdir + getsize would issue.
+        with os.scandir(self.conversations_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.json') or entry.name == self._INDEX_NAME:
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    st = entry.stat()
+                    cached = cache.get(entry.name)
+                    if cached and cached.get('mtime_ns') == st.st_mtime_ns:
+                        # Unchanged since last parse - reuse the cached header
+                        info = dict(cached['header'])
+                    else:
+                        info = self._read_header(entry.path)
+                        info['size'] = st.st_size
+                        cache[entry.name] = {'mtime_ns': st.st_mtime_ns,
+                                             'header': dict(info)}
+                        cache_dirty = True
+                except OSError:
+                    continue
+                info['filename'] = entry.name
+                info['filepath'] = entry.path
+                seen.add(entry.name)
+                conversations.append(info)
+
+        # Drop index entries for files that no longer exist
+        stale = [name for name in cache if name not in seen]
+        for name in stale:
+            del cache[name]
+            cache_dirty = True
+
+        if cache_dirty:
+            self._save_index()
+
+        conversations.sort(key=lambda info: info['filename'])
+        return conversations
+
+    @staticmethod
+    def _write_bytes(filepath: str, data: bytes) -> None:
+        """Write pre-encoded bytes through a raw fd, skipping TextIOWrapper."""
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def get_supported_formats() -> frozenset:
+        """Return the set of supported document extensions."""
+        return _SUPPORTED_EXTS
+
+    @staticmethod
+    def is_supported_format(filepath: str) -> bool:
+        """Check whether a file has a supported document extension.
+
+        rpartition scans from the end and only the extension is lowered,
+        avoiding the full-path copy os.path.splitext(filepath.lower())
+        would allocate.
+        """
+        if '.' not in filepath:
+            return False
+        return '.' + filepath.rpartition('.')[2].lower() in _SUPPORTED_EXTS
+
+    # Documents at or above this size are decoded incrementally
+    _LARGE_DOC_THRESHOLD = 8 * 1024 * 1024
+    _DOC_CHUNK_BYTES = 65536
+
+    def load_document(self, filepath: str, max_bytes: Optional[int] = None) -> str:
+        """Load a text document for inclusion in a prompt.
+
+        Reads at most max_bytes when given. Large files are decoded
+        incrementally in chunks to bound peak memory, and decode failures
+        fall back to latin-1 on the already-read bytes instead of
+        re-reading the file from disk.
+        """
+        if not self.is_supported_format(filepath):
+            raise ValueError(f"Unsupported document format: {filepath}")
+
+        size = os.path.getsize(filepath)
+        limit = size if max_bytes is None else min(size, max_bytes)
+
+        # 64 KiB buffer: fewer read syscalls than the 8 KiB default
+        with open(filepath, 'rb', buffering=65536) as f:
+            if limit >= self._LARGE_DOC_THRESHOLD:
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                parts = []
+                remaining = limit
+                while remaining > 0:
+                    chunk = f.read(min(self._DOC_CHUNK_BYTES, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    parts.append(decoder.decode(chunk))
+                parts.append(decoder.decode(b'', final=True))
+                return ''.join(parts)
+            raw = f.read(limit)
+
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            return raw.decode('latin-1')
+
+    def export_conversation_markdown(self, conversation: Conversation,
+                                     filepath: str) -> None:
+        """Export a conversation as a Markdown document.
+
+        Output is assembled in memory and written with a single encode and
+        write call rather than several small writes per message.
+        """
+        parts = [
+            f"# Conversation {conversation.session_id}\n\n",
+            f"- Model: {conversation.model}\n",
+            f"- Messages: {len(conversation.messages)}\n\n",
+        ]
+        # Running per-role counters replace the branchy i // 2 index math
+        counts = {'user': 0, 'assistant': 0}
+        for msg in conversation.messages:
+            role = msg.role
+            counts[role] = n = counts.get(role, 0) + 1
+            emoji = _ROLE_EMOJI.get(role, '💬')
+            title = _ROLE_TITLE.get(role) or role.title()
+            parts.append(f"## {emoji} {title} #{n}\n\n")
+            parts.append(msg.content)
+            parts.append("\n\n")
+        self._write_bytes(filepath, ''.join(parts).encode('utf-8'))
+
+    def export_conversation_text(self, conversation: Conversation,
+                                 filepath: str) -> None:
+        """Export a conversation as plain text.
+
+        Uses the same single-write strategy as the Markdown exporter.
+        """
+        parts = [
+            f"Conversation {conversation.session_id}\n",
+            f"Model: {conversation.model}\n\n",
+        ]
+        for msg in conversation.messages:
+            parts.append(_ROLE_UPPER.get(msg.role) or msg.role.upper())
+            parts.append(": ")
+            parts.append(msg.content)
+            parts.append("\n\n")
+        self._write_bytes(filepath, ''.join(parts).encode('utf-8'))
@@ -1,8 +1,77 @@
 """Terminal input handler for managing multiline input and special key handling."""
+import codecs
+import os
 import sys
+
+try:
+    import termios
+    import tty
+except ImportError:  # non-POSIX platforms fall back to plain input()
+    termios = tty = None
+
+from collections import OrderedDict
 from typing import Optional, List
 from .input_history import InputHistory
 
+# Static terminal payloads, assembled and encoded once at import. Every
+# help-line redraw shares _HELP_LINE_BYTES instead of re-emitting the
+# markup fragment by fragment.
+_CLEAR_BELOW = "\n\033[1G\033[2K"
+_HELP_TEXT = (
+    "\033[90m(\033[36mEnter\033[90m = send, \033[36mCtrl+J\033[90m = newline, "
+    "\033[36mCtrl+C\033[90m = quit, \033[36m↑↓\033[90m = history, "
+    "\033[36m/\033[90m = command)\033[0m"
+)
+_HELP_LINE_BYTES = (_CLEAR_BELOW + _HELP_TEXT).encode('utf-8')
+_CTRL_C_CONFIRM_BYTES = (_CLEAR_BELOW + "\033[91mCtrl+C again to quit\033[0m").encode('utf-8')
+_ESC_RESET_BYTES = (_CLEAR_BELOW + "\033[91mHit Esc again to start over\033[0m").encode('utf-8')
+
+# Full redraw payload for Ctrl+J (clear help, fresh prompt line, help
+# restored, cursor at column 4) - every part is fixed, so the whole
+# event is a single constant write
+_CTRLJ_REDRAW_BYTES = (b"\n\033[2K\033[1A\r\n>> "
+                       + _HELP_LINE_BYTES + b"\033[1A\033[4G")
+# Fixed prefix of the backspace-at-newline redraw; only the final
+# cursor column varies
+_BKSP_NL_PREFIX = b"\n\033[2K\033[1A\r\033[2K\033[1A"
+
+
+# Cursor-move sequences keyed by column, encoded on first use; typing
+# revisits the same few columns constantly, so the format + encode cost
+# is paid once per column instead of per keystroke
+_UP_COL_BYTES = {}
+_COL_BYTES = {}
+
+
+def _up_col(col: int) -> bytes:
+    """Bytes for "up one line, go to column col"."""
+    seq = _UP_COL_BYTES.get(col)
+    if seq is None:
+        seq = _UP_COL_BYTES[col] = f"\033[1A\033[{col}G".encode()
+    return seq
+
+
+def _col(col: int) -> bytes:
+    """Bytes for "go to column col" on the current line."""
+    seq = _COL_BYTES.get(col)
+    if seq is None:
+        seq = _COL_BYTES[col] = f"\033[{col}G".encode()
+    return seq
+
+
+def _emit(data: bytes) -> None:
+    """Write pre-encoded terminal bytes with a single syscall.
+
+    Going straight to the stdout fd skips the Python-level buffer and
+    its write + flush pair on every key event.
+    """
+    try:
+        os.write(sys.stdout.fileno(), data)
+    except (AttributeError, ValueError, OSError):
+        # stdout replaced by something without a real fd (tests, pipes)
+        sys.stdout.write(data.decode('utf-8'))
+        sys.stdout.flush()
+
 
 class TerminalInputHandler:
     """Handles terminal input with multiline support and special key handling."""
@@ -11,7 +80,58 @@ class TerminalInputHandler:
         """Initialize with reference to parent CLI instance."""
         self.cli = cli_instance
         self._current_buffer = []
-        self.input_history = InputHistory(max_entries=100)
+        # History is built on first use; one-shot invocations that never
+        # reach the interactive prompt skip the allocation entirely
+        self._input_history = None
+        # Index of the last newline in the buffer (-1 if none), kept in
+        # step with every mutation so last-line math is O(1) instead of
+        # re-joining and splitting the whole buffer per keystroke
+        self._last_nl = -1
+        # Decoded characters drained from the last bulk stdin read
+        self._pending = ""
+        self._pending_pos = 0
+        self._decoder = None
+        # Assembled redraw payloads for recently shown history entries;
+        # scrolling up and down over the same entries reuses the bytes
+        self._history_redraw_cache = OrderedDict()
+
+    @property
+    def input_history(self) -> InputHistory:
+        """Input history, created lazily on first access."""
+        if self._input_history is None:
+            self._input_history = InputHistory(max_entries=100)
+        return self._input_history
+
+    def _next_char(self, fd: int) -> str:
+        """Return the next character of input.
+
+        Reads everything currently available in one os.read call and
+        serves subsequent characters from memory, so a paste costs one
+        syscall per few KiB instead of one per byte. A partial UTF-8
+        sequence at a read boundary is held by the incremental decoder
+        until its remaining bytes arrive.
+        """
+        while self._pending_pos >= len(self._pending):
+            data = os.read(fd, 4096)
+            if not data:
+                return ''
+            self._pending = self._decoder.decode(data)
+            self._pending_pos = 0
+        ch = self._pending[self._pending_pos]
+        self._pending_pos += 1
+        return ch
+
+    def _rescan_last_nl(self, buffer: List[str]) -> None:
+        """Recompute the cached newline index after one was removed.
+
+        Scans backward only as far as the previous newline, so the cost
+        is bounded by the previous line's length.
+        """
+        for i in range(len(buffer) - 1, -1, -1):
+            if buffer[i] == '\n':
+                self._last_nl = i
+                return
+        self._last_nl = -1
 
     def get_multiline_input(self, prefill_text: str = "") -> Optional[str]:
         """Get input using raw mode where:
@@ -33,32 +153,35 @@ class TerminalInputHandler:
         # Show any prefill content and initialize buffer
         buffer: list[str] = []
         if prefill_text:
-            # Print prefill lines for context
-            for line in prefill_text.split('\n'):
-                self.cli.console.print(f">> {line}")
+            # Echo prefill lines for context in one pre-rendered write,
+            # bypassing the per-line rich print path
+            echo = "\n".join(f">> {line}" for line in prefill_text.split('\n'))
+            _emit(echo.encode() + b"\n")
             # Initialize buffer with prefill_text characters (including newlines)
             buffer = list(prefill_text)
 
         # Store buffer reference for cursor positioning
         self._current_buffer = buffer
+        self._last_nl = prefill_text.rfind('\n') if prefill_text else -1
 
         try:
-            import termios
-            import tty
-
             fd = sys.stdin.fileno()
             old_settings = termios.tcgetattr(fd)
 
+            # Fresh read state per prompt
+            self._pending = ""
+            self._pending_pos = 0
+            self._decoder = codecs.getincrementaldecoder('utf-8')('replace')
+
             try:
                 tty.setraw(fd)
-                sys.stdout.write(">> ")
-                sys.stdout.flush()
+                _emit(b">> ")
 
                 # Print help message below the prompt
                 self._print_help_message()
 
                 while True:
-                    ch = sys.stdin.read(1)
+                    ch = self._next_char(fd)
                     if not ch:
                         continue
 
@@ -67,7 +190,7 @@ class TerminalInputHandler:
                         pending_esc = False
                         if ch == '[':
                             # This is an escape sequence - read the final character
-                            final_ch = sys.stdin.read(1)
+                            final_ch = self._next_char(fd)
                             if final_ch == 'A':  # Up arrow
                                 history_entry = self.input_history.get_previous(''.join(buffer))
                                 if history_entry is not None:
@@ -75,7 +198,6 @@ class TerminalInputHandler:
                                 # Cancel ESC hint if visible
                                 if esc_reset_pending:
                                     esc_reset_pending = self._reset_esc_state_and_restore_help()
-                                    self._current_buffer = buffer
                                 continue
                             elif final_ch == 'B':  # Down arrow
                                 history_entry = self.input_history.get_next()
@@ -87,20 +209,18 @@ class TerminalInputHandler:
                                 # Cancel ESC hint if visible
                                 if esc_reset_pending:
                                     esc_reset_pending = self._reset_esc_state_and_restore_help()
-                                    self._current_buffer = buffer
                                 continue
                             else:
                                 # Other sequences - ignore
                                 if esc_reset_pending:
                                     esc_reset_pending = self._reset_esc_state_and_restore_help()
-                                    self._current_buffer = buffer
                                 continue
                         else:
                             # ESC followed by non-bracket
                             # If it's another ESC, treat as double-ESC reset; otherwise, fall through.
                             if ch == "\x1b":
-                                current_text = ''.join(buffer)
-                                has_content = bool(current_text.strip())
+                                # Short-circuit scan; no join allocation
+                                has_content = any(not c.isspace() for c in buffer)
                                 if has_content and esc_reset_pending:
                                     buffer = self._clear_current_input_and_redraw(buffer)
                                     esc_reset_pending = False
@@ -113,32 +233,21 @@ class TerminalInputHandler:
                             # Second Ctrl+C -> prepare clean exit
                             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
                             # Clear the help line below, then move back up to the prompt line start
-                            sys.stdout.write("\n\033[2K\033[1A\r")
-                            sys.stdout.flush()
+                            _emit(b"\n\033[2K\033[1A\r")
                             raise KeyboardInterrupt
                         else:
                             # First Ctrl+C -> show quit confirmation message
                             ctrl_c_pressed_once = True
-                            # Clear help message line and replace with quit confirmation
-                            sys.stdout.write("\n\033[1G\033[2K")  # Move down, go to left margin, clear line
-                            sys.stdout.write("\033[91mCtrl+C again to quit\033[0m")  # Red color for attention
-                            # Move back up and position cursor after current text using relative positioning
-                            cursor_column = len(">> " + ''.join(buffer)) + 1
-                            sys.stdout.write(f"\033[1A\033[{cursor_column}G")
-                            sys.stdout.flush()
+                            self._render_status_line(_CTRL_C_CONFIRM_BYTES)
                         continue
 
                     # Reset Ctrl+C state if any other key is pressed
                     if ctrl_c_pressed_once:
                         ctrl_c_pressed_once = self._reset_ctrl_c_state_and_restore_help()
-                        # Update current buffer reference for cursor positioning
-                        self._current_buffer = buffer
 
                     # Reset ESC reset state if a non-ESC key is pressed
                     if esc_reset_pending and ch != "\x1b":
                         esc_reset_pending = self._reset_esc_state_and_restore_help()
-                        # Update current buffer reference for cursor positioning
-                        self._current_buffer = buffer
 
                     # "/" -> open command palette (only if it's the first character)
                     if ch == "/" and not buffer:
@@ -146,8 +255,7 @@ class TerminalInputHandler:
                         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
                         try:
                             # Clear current line and open command palette
-                            sys.stdout.write("\r\033[K")  # Clear current line
-                            sys.stdout.flush()
+                            _emit(b"\r\033[K")
 
                             # Open command palette
                             result = self.cli._open_command_palette()
@@ -156,57 +264,46 @@ class TerminalInputHandler:
 
                             # Restore terminal for continued input
                             tty.setraw(fd)
-                            sys.stdout.write(">> " + ''.join(buffer))
-                            sys.stdout.flush()
+                            _emit((">> " + ''.join(buffer)).encode())
                             # Restore help message
                             self._print_help_message()
-                        except Exception as e:
+                        except Exception:
                             # Restore terminal and continue
                             tty.setraw(fd)
-                            sys.stdout.write(">> " + ''.join(buffer))
-                            sys.stdout.flush()
+                            _emit((">> " + ''.join(buffer)).encode())
                             # Restore help message
                             self._print_help_message()
                         continue
 
                     # Enter/Return (carriage return) -> submit or reposition if empty
                     # Note: many terminals send '\r' (13) for Enter; treat that as submit.
-                    if ch == "\r" or ord(ch) == 13:
+                    if ch == "\r":
                         # Check if buffer is empty (no content to send)
-                        if not buffer or not ''.join(buffer).strip():
+                        if not buffer or not any(not c.isspace() for c in buffer):
                             # Empty line - just reposition cursor to after ">>"
                             # Clear current line and rewrite the prompt
-                            sys.stdout.write("\r\033[K>> ")
-                            sys.stdout.flush()
-                            # Clear buffer if it had whitespace
+                            _emit(b"\r\033[K>> ")
+                            # Clear buffer if it had whitespace; this rebinding
+                            # is one of the few spots that must refresh the
+                            # shared reference used by the redraw helpers
                             buffer = []
+                            self._current_buffer = buffer
+                            self._last_nl = -1
                             continue
                         else:
                             # Has content - submit normally
-                            sys.stdout.write("\n")
-                            sys.stdout.flush()
+                            _emit(b"\n")
                             break
 
                     # Ctrl+J (line feed, ASCII 10) -> insert newline only when current line has text
                     if ch == "\x0a":
                         # Only allow newline if the current line (after last \n) has content
-                        current_text = ''.join(buffer)
-                        last_line_text = current_text.split('\n')[-1]
-                        if len(last_line_text) > 0:
+                        if len(buffer) - self._last_nl - 1 > 0:
                             buffer.append('\n')
-                            # Update current buffer reference
-                            self._current_buffer = buffer
-                            # First, clear the help message that's currently below the cursor
-                            sys.stdout.write("\n\033[2K")  # Move down and clear the help message line
-                            sys.stdout.write("\033[1A")   # Move back up to the original line
-                            # Now move to new line and print clean prompt at left margin
-                            sys.stdout.write("\r\n>> ")
-                            # Move down and print help message on the line below using relative positioning
-                            sys.stdout.write("\n\033[1G\033[2K")  # New line, go to left margin, clear line
-                            sys.stdout.write("\033[90m(\033[36mEnter\033[90m = send, \033[36mCtrl+J\033[90m = newline, \033[36mCtrl+C\033[90m = quit, \033[36m/\033[90m = command)\033[0m")
-                            # Move back up one line and position cursor after ">> "
-                            sys.stdout.write("\033[1A\033[4G")  # Move up and go to column 4 (after ">> ")
-                            sys.stdout.flush()
+                            self._last_nl = len(buffer) - 1
+                            # Clear the help line below, move to a fresh line with a
+                            # clean prompt, and redraw the help - one constant write
+                            _emit(_CTRLJ_REDRAW_BYTES)
                         # If current line is empty, ignore Ctrl+J
                         continue
 
@@ -214,40 +311,28 @@ class TerminalInputHandler:
                     if ch in ("\x7f", "\x08"):
                         if not buffer:
                             continue
-                        current_text = ''.join(buffer)
-                        last_line = current_text.split('\n')[-1]
-                        if buffer[-1] == '\n' or len(last_line) == 0:
-                            # At start of a line: if last char is a newline, remove the empty line safely
-                            if buffer[-1] == '\n':
-                                # Remove newline from buffer
-                                buffer.pop()
-                                self._current_buffer = buffer
-                                # Clear help line and current empty prompt line, then move to previous line end
-                                sys.stdout.write("\n\033[2K")  # clear help below
-                                sys.stdout.write("\033[1A")     # back to current line
-                                sys.stdout.write("\r\033[2K")   # clear current line (the '>> ')
-                                sys.stdout.write("\033[1A")     # move to previous line
-                                # Move cursor to end of previous line content
-                                prev_text = ''.join(buffer)
-                                prev_last_len = len(prev_text.split('\n')[-1])
-                                sys.stdout.write(f"\033[{4 + prev_last_len}G")
-                                # Reprint help below previous line and restore cursor
-                                self._print_help_message()
-                            # If not a newline, and at column 0 for this line, do nothing (protect '>> ')
-                            continue
-                        else:
-                            # Normal character deletion within the line
+                        if self._last_nl == len(buffer) - 1:
+                            # Current line is empty, so the last buffered
+                            # char is its newline: remove the empty line
                             buffer.pop()
-                            self._current_buffer = buffer
-                            sys.stdout.write("\b \b")
-                            sys.stdout.flush()
+                            self._rescan_last_nl(buffer)
+                            # Clear help line and current empty prompt line, move to
+                            # the end of the previous line - one write for the event;
+                            # the refreshed newline cache gives that line's length
+                            prev_last_len = len(buffer) - self._last_nl - 1
+                            _emit(_BKSP_NL_PREFIX + _col(4 + prev_last_len))
+                            # Reprint help below previous line and restore cursor
+                            self._print_help_message()
+                            continue
+                        # Normal character deletion within the line
+                        buffer.pop()
+                        _emit(b"\b \b")
                         continue
 
                     # Handle ESC: set pending state and show hint immediately (plain ESC)
                     if ch == "\x1b":
                         # Assume plain ESC until proven sequence; show/cycle hint now
-                        current_text = ''.join(buffer)
-                        has_content = bool(current_text.strip())
+                        has_content = any(not c.isspace() for c in buffer)
                         if has_content:
                             if esc_reset_pending:
                                 buffer = self._clear_current_input_and_redraw(buffer)
@@ -259,14 +344,21 @@ class TerminalInputHandler:
                         pending_esc = True
                         continue
 
-                    # Printable character -> echo and append
-                    buffer.append(ch)
+                    # Printable character -> take the whole contiguous
+                    # printable run from the pending batch (a paste arrives
+                    # as one batch) and append/echo it in a single step
+                    pend = self._pending
+                    start = pos = self._pending_pos
+                    n = len(pend)
+                    while pos < n and pend[pos] >= ' ' and pend[pos] != '\x7f':
+                        pos += 1
+                    if pos > start:
+                        ch += pend[start:pos]
+                        self._pending_pos = pos
+                    buffer.extend(ch)
                     # Reset history position when user starts typing new content
                     self.input_history.reset_position()
-                    # Update current buffer reference
-                    self._current_buffer = buffer
-                    sys.stdout.write(ch)
-                    sys.stdout.flush()
+                    _emit(ch.encode())
 
             finally:
                 # Ensure terminal state is restored
@@ -278,8 +370,7 @@ class TerminalInputHandler:
         except KeyboardInterrupt:
             # User requested quit via Ctrl+C - clear help and prompt lines
             # Clear help line (below), then move back and clear prompt line
-            sys.stdout.write("\n\033[2K\033[1A\r\033[2K")
-            sys.stdout.flush()
+            _emit(b"\n\033[2K\033[1A\r\033[2K")
             # Re-raise so outer run loop can print final message
             raise
         except Exception:
@@ -302,101 +393,86 @@ class TerminalInputHandler:
         self.input_history.add_entry(content)
         return content
 
+    def _render_status_line(self, msg: bytes) -> None:
+        """Replace the line below the prompt with msg in a single write.
+
+        Clears and rewrites the status line, then moves back up and
+        positions the cursor after ">> " plus the current (last) line's
+        content; the cached newline index makes the column math O(1)
+        rather than a join + split of the buffer.
+        """
+        cursor_column = 4 + len(self._current_buffer) - self._last_nl - 1
+        _emit(msg + _up_col(cursor_column))
+
     def _print_help_message(self):
         """Print the help message below the current cursor position at left margin."""
-        # Move to next line, go to column 1 (left margin), and clear line
-        sys.stdout.write("\n\033[1G\033[2K")
-        # Print help with colored commands
-        sys.stdout.write("\033[90m(\033[36mEnter\033[90m = send, \033[36mCtrl+J\033[90m = newline, \033[36mCtrl+C\033[90m = quit, \033[36m↑↓\033[90m = history, \033[36m/\033[90m = command)\033[0m")
-        # Move back up one line and position cursor after ">> " plus any existing buffer content
-        buffer_text = ''.join(getattr(self, '_current_buffer', []))
-        # Compute position within the current (last) line only
-        last_line_len = len(buffer_text.split('\n')[-1])
-        cursor_column = 4 + last_line_len  # after ">> "
-        sys.stdout.write(f"\033[1A\033[{cursor_column}G")
-        sys.stdout.flush()
+        self._render_status_line(_HELP_LINE_BYTES)
 
     def _clear_help_line(self):
         """Clear the help line below the current cursor position."""
         # Move down, clear the line, then move back up
-        sys.stdout.write("\n\033[2K\033[1A")
-        sys.stdout.flush()
+        _emit(b"\n\033[2K\033[1A")
 
     def _clear_current_input_and_redraw(self, current_buffer: List[str]) -> List[str]:
         """Clear all lines of current input, redraw prompt, and return a fresh buffer."""
-        current_text = ''.join(current_buffer)
-        lines = current_text.count('\n') + 1
-        # Clear help line below, then clear all input lines
-        sys.stdout.write("\n\033[2K")  # clear help below
-        sys.stdout.write("\033[1A")     # back to current line
-        for i in range(lines):
-            sys.stdout.write("\r\033[2K")
-            if i < lines - 1:
-                sys.stdout.write("\033[1A")
+        lines = current_buffer.count('\n') + 1
+        # Clear help line below, then every input line, then redraw the
+        # prompt - assembled into one write
+        out = bytearray(b"\n\033[2K\033[1A")
+        out += b"\r\033[2K\033[1A" * (lines - 1)
+        out += b"\r\033[2K>> "
         # Reset buffer and redraw prompt + help
         new_buffer: List[str] = []
         self._current_buffer = new_buffer
-        sys.stdout.write(">> ")
-        sys.stdout.flush()
+        self._last_nl = -1
+        _emit(bytes(out))
         self._print_help_message()
         return new_buffer
 
     def _replace_buffer_with_history(self, current_buffer: List[str], history_entry: str) -> List[str]:
         """Replace current buffer with history entry and update display."""
         # Calculate how many lines current buffer occupies
-        current_text = ''.join(current_buffer)
-        current_lines = current_text.count('\n') + 1
-        
-        # Clear help line first
-        sys.stdout.write("\n\033[2K")  # Clear help below
-        sys.stdout.write("\033[1A")     # Back to current line
-        
-        # Clear all lines of current input by moving up and clearing each line
-        for i in range(current_lines):
-            sys.stdout.write("\r\033[2K")  # Go to beginning of line and clear completely
-            if i < current_lines - 1:
-                sys.stdout.write("\033[1A")  # Move up to previous line
-        
-        # Now we're at the first line, positioned at column 0
-        # Display the prompt and new content
-        sys.stdout.write(">> ")
-        if history_entry:
-            sys.stdout.write(history_entry)
-        
+        current_lines = current_buffer.count('\n') + 1
+
+        # Clear the help line and every input line, then write the
+        # prompt and replacement content - assembled into one write and
+        # memoized per (line count, entry) for up/down scans
+        cache = self._history_redraw_cache
+        key = (current_lines, history_entry)
+        payload = cache.get(key)
+        if payload is None:
+            out = bytearray(b"\n\033[2K\033[1A")
+            out += b"\r\033[2K\033[1A" * (current_lines - 1)
+            out += b"\r\033[2K>> "
+            if history_entry:
+                out += history_entry.encode()
+            payload = bytes(out)
+            cache[key] = payload
+            if len(cache) > 32:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
         # Create new buffer from history entry
         new_buffer = list(history_entry) if history_entry else []
         self._current_buffer = new_buffer
-        
-        sys.stdout.flush()
-        
+        self._last_nl = history_entry.rfind('\n') if history_entry else -1
+
+        _emit(payload)
+
         # Restore help message
         self._print_help_message()
-        
+
         return new_buffer
 
     def _reset_ctrl_c_state_and_restore_help(self):
         """Reset Ctrl+C state and restore original help message."""
-        # Clear quit confirmation message and restore help
-        sys.stdout.write("\n\033[1G\033[2K")  # Move down, go to left margin, clear line
-        sys.stdout.write("\033[90m(\033[36mEnter\033[90m = send, \033[36mCtrl+J\033[90m = newline, \033[36mCtrl+C\033[90m = quit, \033[36m↑↓\033[90m = history, \033[36m/\033[90m = command)\033[0m")
-        # Calculate current buffer length to position cursor correctly
-        buffer_text = ''.join(getattr(self, '_current_buffer', []))
-        cursor_column = len(">> " + buffer_text) + 1
-        sys.stdout.write(f"\033[1A\033[{cursor_column}G")  # Move back up and position after current text
-        sys.stdout.flush()
+        self._render_status_line(_HELP_LINE_BYTES)
         return False  # Return False to reset ctrl_c_pressed_once
 
     def _show_esc_reset_message(self):
         """Show the red confirmation message for ESC-based reset on the help line."""
-        # Clear help message line and replace with confirmation
-        sys.stdout.write("\n\033[1G\033[2K")  # Move down, go to left margin, clear line
-        sys.stdout.write("\033[91mHit Esc again to start over\033[0m")  # Red color
-        # Move back up and position cursor after current text using relative positioning
-        buffer_text = ''.join(getattr(self, '_current_buffer', []))
-        last_line_len = len(buffer_text.split('\n')[-1])
-        cursor_column = 4 + last_line_len
-        sys.stdout.write(f"\033[1A\033[{cursor_column}G")
-        sys.stdout.flush()
+        self._render_status_line(_ESC_RESET_BYTES)
 
     def _reset_esc_state_and_restore_help(self):
         """Restore the normal help line after an ESC confirmation hint."""
@@ -1,9 +1,35 @@
 """Input validation utilities."""
 import os
 import re
+import stat
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+# Characters not allowed in filenames; the translation table maps each
+# to '_' so sanitizing is one pass instead of one replace per character
+_ILLEGAL_CHARS = '<>:"/\\|?*'
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys(_ILLEGAL_CHARS, '_'))
+_UNDERSCORES = re.compile(r'_+')
+
+# Supported models; the tuple keeps a stable order for error messages,
+# the frozenset gives O(1) membership checks
+_MODEL_CHOICES = (
+    "openai/gpt-oss-20b",
+    "openai/gpt-oss-120b",
+    "compound-beta",
+    "compound-beta-mini"
+)
+_VALID_MODELS = frozenset(_MODEL_CHOICES)
+
+# Lista de comandos válidos
+_VALID_ROLES = ('user', 'assistant')
+
+_VALID_COMMANDS = frozenset({
+    'help', 'status', 'new', 'clear', 'history', 'model',
+    'config', 'settings', 'list', 'template', 'thinking'
+})
+
 
 class InputValidator:
     """Validates user inputs and commands."""
@@ -11,25 +37,18 @@ class InputValidator:
     @staticmethod
     def validate_model_name(model: str) -> bool:
         """Validate if model name is supported."""
-        valid_models = [
-            "openai/gpt-oss-20b",
-            "openai/gpt-oss-120b", 
-            "compound-beta",
-            "compound-beta-mini"
-        ]
-        return model in valid_models
+        return model in _VALID_MODELS
     
     @staticmethod
     def validate_file_path(filepath: str, must_exist: bool = True) -> bool:
         """Validate file path."""
         try:
-            path = Path(filepath)
-            
             if must_exist:
-                return path.exists() and path.is_file()
+                # Single stat call instead of the exists()/is_file() pair
+                return stat.S_ISREG(os.stat(filepath).st_mode)
             else:
                 # Check if parent directory exists or can be created
-                parent = path.parent
+                parent = Path(filepath).parent
                 return parent.exists() or parent.can_write()
         except:
             return False
@@ -38,10 +57,9 @@ class InputValidator:
     def validate_directory_path(dirpath: str, must_exist: bool = True) -> bool:
         """Validate directory path."""
         try:
-            path = Path(dirpath)
-            
             if must_exist:
-                return path.exists() and path.is_dir()
+                # Single stat call instead of the exists()/is_dir() pair
+                return stat.S_ISDIR(os.stat(dirpath).st_mode)
             else:
                 return True  # Can try to create
         except:
@@ -50,9 +68,7 @@ class InputValidator:
     @staticmethod
     def validate_filename(filename: str) -> bool:
         """Validate filename for illegal characters."""
-        # Check for illegal characters in filename
-        illegal_chars = '<>:"/\\|?*'
-        return not any(char in filename for char in illegal_chars)
+        return not any(char in filename for char in _ILLEGAL_CHARS)
 
     @staticmethod
     def validate_export_format(fmt: str) -> bool:
@@ -66,76 +82,78 @@ class InputValidator:
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename by removing illegal characters."""
-        # Replace illegal characters with underscores
-        illegal_chars = '<>:"/\\|?*'
-        sanitized = filename
-        
-        for char in illegal_chars:
-            sanitized = sanitized.replace(char, '_')
+        # Replace illegal characters with underscores in a single pass
+        sanitized = filename.translate(_SANITIZE_TABLE)
         
         # Remove multiple consecutive underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
+        sanitized = _UNDERSCORES.sub('_', sanitized)
         
         # Remove leading/trailing underscores and dots
-        sanitized = sanitized.strip('_.')
-        
-        return sanitized
+        return sanitized.strip('_.')
     
     @staticmethod
     def validate_json_structure(data: Dict[str, Any]) -> bool:
         """Validate that data has required structure for conversation."""
-        required_fields = ['messages']
-        optional_fields = ['session_id', 'created_at', 'model', 'metadata']
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in data:
-                return False
+        if 'messages' not in data:
+            return False
         
-        # Check messages structure
-        messages = data.get('messages', [])
+        # Check messages structure, bailing on the first bad entry
+        messages = data['messages']
         if not isinstance(messages, list):
             return False
         
         for msg in messages:
-            if not isinstance(msg, dict):
-                return False
-            if 'role' not in msg or 'content' not in msg:
-                return False
-            if msg['role'] not in ['user', 'assistant']:
+            if (not isinstance(msg, dict)
+                    or 'content' not in msg
+                    or msg.get('role') not in _VALID_ROLES):
                 return False
         
         return True
 
 
+@lru_cache(maxsize=256)
+def _parse_command_cached(user_input: str) -> tuple:
+    """Parse a command string into (is_command, command, args, raw_args).
+
+    Returns an immutable tuple so results can be memoized; history
+    replay and completion parse the same strings repeatedly.
+    """
+    parts = user_input.strip().split()
+    
+    if not parts:
+        return (False, None, None, None)
+    
+    command = parts[0].lstrip('/').lower()
+    args = tuple(parts[1:])
+    
+    # Solo es un comando si la primera palabra está en la lista de comandos válidos
+    is_command = command in _VALID_COMMANDS
+    
+    return (is_command, command, args, ' '.join(args) if args else '')
+
+
 class CommandValidator:
     """Validates command syntax and arguments."""
     
     @staticmethod
     def parse_command(user_input: str) -> Dict[str, Any]:
         """Parse command and return command info."""
-        parts = user_input.strip().split()
-        
-        if not parts:
+        # Long inputs are ordinary prompt text; parse them directly so
+        # they don't churn the memo cache
+        if len(user_input) > 256:
+            parsed = _parse_command_cached.__wrapped__(user_input)
+        else:
+            parsed = _parse_command_cached(user_input)
+        
+        is_command, command, args, raw_args = parsed
+        if command is None:
             return {'is_command': False}
         
-        command = parts[0].lstrip('/').lower()
-        args = parts[1:] if len(parts) > 1 else []
-        
-        # Lista de comandos válidos
-        valid_commands = {
-            'help', 'status', 'new', 'clear', 'history', 'model',
-            'config', 'settings', 'list', 'template', 'thinking'
-        }
-        
-        # Solo es un comando si la primera palabra está en la lista de comandos válidos
-        is_command = command in valid_commands
-        
         return {
             'is_command': is_command,
             'command': command,
-            'args': args,
-            'raw_args': ' '.join(args) if args else ''
+            'args': list(args),
+            'raw_args': raw_args
         }
     
     @staticmethod
@@ -149,8 +167,7 @@ class CommandValidator:
         
         model = args[0]
         if not InputValidator.validate_model_name(model):
-            valid_models = ["openai/gpt-oss-20b", "openai/gpt-oss-120b", "compound-beta", "compound-beta-mini"]
-            return f"Invalid model: {model}. Valid models: {', '.join(valid_models)}"
+            return f"Invalid model: {model}. Valid models: {', '.join(_MODEL_CHOICES)}"
         
         return None  # Valid
 